@@ -1,4 +1,5 @@
 from pathlib import Path
+import copy
 import json
 from docx import Document
 from .docx_props import set_doc_properties
@@ -18,6 +19,37 @@ from .schema import validate_input_payload
 from ..config_loader import load_profiles  # you already have this in v9+
 
 
+# Parsed templates for this process: path -> (mtime_ns, Document)
+_TEMPLATE_CACHE: dict = {}
+
+
+def _open_template(template_path: Path):
+    """
+    Return a fresh Document for the template. The template is parsed once
+    per process and deep-copied for each document; if copying fails the
+    template is simply reopened.
+    """
+    path = Path(template_path).resolve()
+    mtime = path.stat().st_mtime_ns
+    cached = _TEMPLATE_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = _TEMPLATE_CACHE[path] = (mtime, Document(str(path)))
+    try:
+        return copy.deepcopy(cached[1])
+    except Exception:
+        return Document(str(path))
+
+
+def _output_name(meta: dict) -> str:
+    return f"{meta.get('doc_id','DOC')} {meta.get('title','Document')} v{meta.get('version','1.0')}.docx"
+
+
+def output_path_for(json_path: Path, output_dir: Path) -> Path:
+    """Path generate_isms_doc will write for this input (named from its metadata)."""
+    data = json.loads(Path(json_path).read_text(encoding="utf-8"))
+    return Path(output_dir) / _output_name(data.get("metadata", {}))
+
+
 def _validate_sections(doc_type: str, sections: dict, profiles: dict) -> list[tuple[str, str]]:
     """
     Return a list of validation messages (severity, message).
@@ -86,12 +118,10 @@ def generate_isms_doc(json_path: Path, template_path: Path, output_dir: Path) ->
 
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
-    output_name = f"{meta.get('doc_id','DOC')} {meta.get('title','Document')} v{meta.get('version','1.0')}.docx"
-    output_path = output_dir / output_name
+    output_path = output_dir / _output_name(meta)
 
     # Start from the master base template
-    output_path.write_bytes(Path(template_path).read_bytes())
-    doc = Document(str(output_path))
+    doc = _open_template(template_path)
 
     # Validation & ordering
     msgs, keymap, required, optional = _validate_sections(doc_type, sections, profiles)
@@ -6,30 +6,41 @@ Tiny CLI wrapper for the schema-driven ISMS document generator (v2).
 Commands:
 - validate: validate JSON against DocumentModel
 - generate: validate JSON and render a .docx using the base template
+- generate-batch: render several JSON inputs in parallel worker processes
 """
 
 from __future__ import annotations
 
 import argparse
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional, Tuple
 
 from pydantic import ValidationError
 
 from .models import DocumentModel
 from .renderers.word_renderer import render_document
-from .importers.word_importer import import_word_to_document_dict
+from .importers.word_importer import import_word_to_document_dict, write_json
 
 #from src.isms_core_v2 import registers  # or from . import registers if cli.py is inside the package
 from . import registers
 from . import dropbox_io
 
-import json
-
 def _resolve_path(p: str | Path) -> Path:
     return Path(p).expanduser().resolve()
 
 
+def _positive_int(value: str) -> int:
+    """argparse type: an integer >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 
 def cmd_validate(args: argparse.Namespace) -> int:
     """
@@ -107,11 +118,9 @@ def cmd_generate(args: argparse.Namespace) -> int:
 
     # After successful generation, optionally update registers
     if getattr(args, "update_dcr", None):
-        registers.update_document_control_register(
-            register_path=args.update_dcr,
-            model=model,
-            output_path=output_path,
-        )
+        dcr_store = registers.DCRStore(args.update_dcr)
+        dcr_store.upsert(model, output_path)
+        dcr_store.flush()
         print(f"[INFO] Updated Document Control Register: {args.update_dcr}")
 
     if getattr(args, "update_mrr", None):
@@ -144,6 +153,96 @@ def cmd_generate(args: argparse.Namespace) -> int:
     return 0
 
 
+def _render_one(job: Tuple[Path, Path, Path]) -> Tuple[Path, Path, Optional[DocumentModel], Optional[str]]:
+    """
+    Validate and render a single JSON input (runs in a worker process).
+
+    Returns (input_path, output_path, model, error); on failure model is None
+    and error holds a message. Registers are left to the parent process.
+    """
+    input_path, template_path, output_path = job
+    try:
+        model = DocumentModel.model_validate_json(input_path.read_bytes())
+    except ValidationError as e:
+        return input_path, output_path, None, f"JSON validation failed:\n{e}"
+    except Exception as e:
+        return input_path, output_path, None, f"Failed to load JSON: {e!r}"
+
+    try:
+        render_document(model, template_path, output_path)
+    except Exception as e:
+        return input_path, output_path, None, f"Failed to render document: {e!r}"
+
+    return input_path, output_path, model, None
+
+
+def cmd_generate_batch(args: argparse.Namespace) -> int:
+    """
+    Validate and render several JSON inputs, one .docx per input, across a
+    pool of worker processes. Register updates happen here, in the parent,
+    once all renders are back (the DCR is written in a single flush).
+    """
+    template_path = _resolve_path(args.template)
+    output_dir = _resolve_path(args.output_dir)
+
+    if not template_path.is_file():
+        print(f"[ERROR] Template not found: {template_path}", file=sys.stderr)
+        return 1
+
+    jobs = []
+    planned: dict[Path, Path] = {}  # output path -> input path
+    for raw in args.inputs:
+        input_path = _resolve_path(raw)
+        if not input_path.is_file():
+            print(f"[ERROR] Input JSON not found: {input_path}", file=sys.stderr)
+            return 1
+        output_path = output_dir / f"{input_path.stem}.docx"
+        other = planned.get(output_path)
+        if other is not None:
+            if other == input_path:
+                continue  # same input listed twice
+            print(
+                f"[ERROR] Inputs {other} and {input_path} would both be written to {output_path}",
+                file=sys.stderr,
+            )
+            return 1
+        planned[output_path] = input_path
+        jobs.append((input_path, template_path, output_path))
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        results = list(pool.map(_render_one, jobs))
+
+    generated = []
+    failed = 0
+    for input_path, output_path, model, error in results:
+        if model is None:
+            failed += 1
+            print(f"[ERROR] {input_path}: {error}", file=sys.stderr)
+            continue
+        generated.append((model, output_path))
+        print(f"[OK] {input_path} -> {output_path}")
+
+    if generated and getattr(args, "update_dcr", None):
+        dcr_store = registers.DCRStore(args.update_dcr)
+        for model, output_path in generated:
+            dcr_store.upsert(model, output_path)
+        dcr_store.flush()
+        print(f"[INFO] Updated Document Control Register: {args.update_dcr}")
+
+    if generated and getattr(args, "update_mrr", None):
+        for model, _ in generated:
+            registers.update_master_reference_register(
+                register_path=args.update_mrr,
+                model=model,
+            )
+        print(f"[INFO] Updated Master Reference Register: {args.update_mrr}")
+
+    print(f"[INFO] Generated {len(generated)} of {len(jobs)} document(s).")
+    return 3 if failed else 0
+
+
 def cmd_import_word(args: argparse.Namespace) -> int:
     """
     Import a Word document and convert it into JSON compatible with DocumentModel.
@@ -175,8 +274,7 @@ def cmd_import_word(args: argparse.Namespace) -> int:
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     try:
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(doc_dict, f, indent=2, ensure_ascii=False)
+        write_json(doc_dict, output_path)
     except Exception as e:
         print("[ERROR] Failed to write output JSON:", file=sys.stderr)
         print(e, file=sys.stderr)
@@ -256,6 +354,50 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_generate.set_defaults(func=cmd_generate)
 
+    # generate-batch
+    p_batch = subparsers.add_parser(
+        "generate-batch",
+        help="Generate Word documents for several JSON inputs in parallel.",
+    )
+    p_batch.add_argument(
+        "inputs",
+        nargs="+",
+        help="Paths to input JSON files.",
+    )
+    p_batch.add_argument(
+        "-t",
+        "--template",
+        default="templates/ISMS_Base_Master.docx",
+        help="Path to the Word template (.docx). "
+             "Defaults to templates/ISMS_Base_Master.docx",
+    )
+    p_batch.add_argument(
+        "-o",
+        "--output-dir",
+        required=True,
+        help="Directory for the generated .docx files (named after each input).",
+    )
+    p_batch.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Number of worker processes. Defaults to the CPU count.",
+    )
+    p_batch.add_argument(
+        "--update-dcr",
+        metavar="PATH",
+        type=Path,
+        help="Optional path to Document Control Register CSV to update/create.",
+    )
+    p_batch.add_argument(
+        "--update-mrr",
+        metavar="PATH",
+        type=Path,
+        help="Optional path to Master Reference Register CSV to update/create.",
+    )
+    p_batch.set_defaults(func=cmd_generate_batch)
+
     # import-word
     p_import = subparsers.add_parser(
         "import-word",
@@ -38,14 +38,221 @@ from __future__ import annotations
 
 import argparse
 import json
+import zipfile
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 import re
 
 from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
 from docx.text.paragraph import Paragraph
-from docx.table import Table
-from docx.oxml.ns import qn
+from lxml import etree
+
+try:  # optional: much faster JSON encoder for large imports
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
+
+# ---------------------------------------------------------------------------
+# Namespaced tag / attribute names
+# ---------------------------------------------------------------------------
+#
+# Precomputed once in Clark notation so the hot loops compare element.tag
+# with == and call find()/get() without going through qn() or nsmap.
+
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+_W_BODY = _W_NS + "body"
+_W_P = _W_NS + "p"
+_W_TBL = _W_NS + "tbl"
+_W_PPR = _W_NS + "pPr"
+_W_PSTYLE = _W_NS + "pStyle"
+_W_NUMPR = _W_NS + "numPr"
+_W_R = _W_NS + "r"
+_W_T = _W_NS + "t"
+_W_RPR = _W_NS + "rPr"
+_W_B = _W_NS + "b"
+_W_I = _W_NS + "i"
+_W_U = _W_NS + "u"
+_W_HYPERLINK = _W_NS + "hyperlink"
+_W_FLDCHAR = _W_NS + "fldChar"
+_W_FLDCHARTYPE = _W_NS + "fldCharType"
+_W_INSTRTEXT = _W_NS + "instrText"
+_W_STYLE = _W_NS + "style"
+_W_NAME = _W_NS + "name"
+_W_VAL = _W_NS + "val"
+_W_TYPE = _W_NS + "type"
+_W_STYLEID = _W_NS + "styleId"
+_W_DEFAULT = _W_NS + "default"
+_R_ID = _R_NS + "id"
+_W_TAB = _W_NS + "tab"
+_W_PTAB = _W_NS + "ptab"
+_W_BR = _W_NS + "br"
+_W_CR = _W_NS + "cr"
+_W_NOBREAKHYPHEN = _W_NS + "noBreakHyphen"
+_W_TR = _W_NS + "tr"
+_W_TC = _W_NS + "tc"
+_W_TCPR = _W_NS + "tcPr"
+_W_GRIDSPAN = _W_NS + "gridSpan"
+_W_VMERGE = _W_NS + "vMerge"
+_W_TBLGRID = _W_NS + "tblGrid"
+_W_GRIDCOL = _W_NS + "gridCol"
+
+_NSMAP = {
+    "w": _W_NS[1:-1],
+    "r": _R_NS[1:-1],
+}
+
+# Compiled once: a paragraph's runs, including runs inside w:hyperlink, in
+# document order (same scope as python-docx's Paragraph.text).
+_XP_PARAGRAPH_RUNS = etree.XPath("w:r | w:hyperlink/w:r", namespaces=_NSMAP)
+
+# Text equivalents of run inner-content elements other than w:t / w:br
+_TEXT_EQUIVALENTS = {
+    _W_TAB: "\t",
+    _W_PTAB: "\t",
+    _W_CR: "\n",
+    _W_NOBREAKHYPHEN: "-",
+}
+
+
+# ---------------------------------------------------------------------------
+# Loading the .docx body
+# ---------------------------------------------------------------------------
+#
+# The importer only needs the body XML, the document relationships (for
+# hyperlink targets) and the style id → name table. Opening the file with
+# python-docx's Document() also loads and resolves every other part in the
+# package (numbering, settings, headers, ...), so we read the three parts we
+# need straight from the zip and keep Document() as a fallback for packages
+# that don't use the standard part names.
+#
+# The parts are parsed with a plain lxml parser (same options as python-docx's
+# parse_xml, without its custom element classes): the importer only uses
+# tag/find/get on the raw elements.
+
+_XML_PARSER = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+
+_DOCUMENT_PART = "word/document.xml"
+_DOCUMENT_RELS_PART = "word/_rels/document.xml.rels"
+_STYLES_PART = "word/styles.xml"
+
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_REL_TYPE_HYPERLINK = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+)
+
+
+def _read_rels_cache(rels_xml: Optional[bytes]) -> Dict[str, str]:
+    """
+    Return a {rId: target} map of the hyperlink relationships in a part's
+    .rels XML (the only ones w:hyperlink/@r:id can point at).
+    """
+    if not rels_xml:
+        return {}
+    root = etree.fromstring(rels_xml, _XML_PARSER)
+    return {
+        rel.get("Id"): rel.get("Target")
+        for rel in root.iterchildren(_PKG_REL_NS + "Relationship")
+        if rel.get("Type") == _REL_TYPE_HYPERLINK
+    }
+
+
+def _read_styles_map(styles_xml: Optional[bytes]) -> Dict[Optional[str], str]:
+    """
+    Return a {styleId: style name} map for paragraph styles.
+
+    The default paragraph style is also stored under the ``None`` key so
+    paragraphs without a w:pStyle resolve the same way python-docx does.
+    """
+    styles_map: Dict[Optional[str], str] = {}
+    if not styles_xml:
+        return styles_map
+
+    root = etree.fromstring(styles_xml, _XML_PARSER)
+    for style in root.iterchildren(_W_STYLE):
+        if style.get(_W_TYPE) != "paragraph":
+            continue
+        name_el = style.find(_W_NAME)
+        name = name_el.get(_W_VAL) if name_el is not None else ""
+        styles_map[style.get(_W_STYLEID)] = name or ""
+        if style.get(_W_DEFAULT) in ("1", "true", "on"):
+            styles_map[None] = name or ""
+    return styles_map
+
+
+_LoadedBody = Tuple[Any, Dict[str, str], Dict[Optional[str], str]]
+
+
+def _load_docx_body_with_python_docx(input_path: Path) -> _LoadedBody:
+    """Fallback loader: open the package with python-docx."""
+    doc = Document(str(input_path))
+    rels_cache = {
+        r_id: str(rel.target_ref)
+        for r_id, rel in doc.part.rels.items()
+        if rel.reltype == _REL_TYPE_HYPERLINK
+    }
+    styles_map: Dict[Optional[str], str] = {}
+    for style in doc.styles:
+        if style.type != WD_STYLE_TYPE.PARAGRAPH:
+            continue
+        styles_map[style.style_id] = style.name or ""
+        if style.element.default:
+            styles_map[None] = style.name or ""
+    return doc.element.body, rels_cache, styles_map
+
+
+def _load_docx_body(input_path: Path) -> _LoadedBody:
+    """
+    Return ``(body, rels_cache, styles_map)`` for a .docx file.
+
+    - body:       the w:body element
+    - rels_cache: {rId: target} for the main document part's hyperlinks
+    - styles_map: {styleId: style name} for paragraph styles
+    """
+    try:
+        with zipfile.ZipFile(input_path) as z:
+            body_xml = z.read(_DOCUMENT_PART)
+            names = set(z.namelist())
+            rels_xml = z.read(_DOCUMENT_RELS_PART) if _DOCUMENT_RELS_PART in names else None
+            styles_xml = z.read(_STYLES_PART) if _STYLES_PART in names else None
+    except (KeyError, zipfile.BadZipFile):
+        # Non-standard part layout (or not a zip at all): let python-docx
+        # resolve the package, or raise its usual error.
+        return _load_docx_body_with_python_docx(input_path)
+
+    body = etree.fromstring(body_xml, _XML_PARSER).find(_W_BODY)
+    return body, _read_rels_cache(rels_xml), _read_styles_map(styles_xml)
+
+
+def _iterparse_body_children(xml_fp: BinaryIO) -> Iterator[Any]:
+    """
+    Yield the top-level w:p / w:tbl elements of a streamed document.xml.
+
+    Each element is cleared (and dropped from w:body) once the caller has
+    moved on, so only the body child being processed is held in memory.
+    """
+    context = etree.iterparse(
+        xml_fp,
+        events=("end",),
+        tag=(_W_P, _W_TBL),
+        remove_blank_text=True,
+        resolve_entities=False,
+    )
+
+    for _event, elem in context:
+        parent = elem.getparent()
+        if parent is None or parent.tag != _W_BODY:
+            continue  # paragraphs inside tables are handled with the table
+        yield elem
+        elem.clear()
+        while elem.getprevious() is not None:
+            del parent[0]
 
 
 # ---------------------------------------------------------------------------
@@ -53,7 +260,29 @@ from docx.oxml.ns import qn
 # ---------------------------------------------------------------------------
 
 
-def extract_runs_with_hyperlinks(paragraph: Paragraph) -> List[Dict[str, Any]]:
+
+@dataclass(slots=True)
+class RunData:
+    """
+    One run fragment of an imported paragraph.
+
+    Slotted to keep the per-run footprint small on large documents; it
+    serialises to the same object as before:
+        {"text": str, "bold": bool, "italic": bool, "underline": bool,
+         "hyperlink": str | None}
+    via write_json() (or dataclasses.asdict).
+    """
+    text: str
+    bold: bool
+    italic: bool
+    underline: bool
+    hyperlink: str | None
+
+
+def extract_runs_with_hyperlinks(
+    paragraph: Paragraph,
+    rels_cache: Optional[Dict[str, str]] = None,
+) -> List[RunData]:
     """
     Return an ordered list of run fragments from a paragraph, preserving:
 
@@ -63,24 +292,64 @@ def extract_runs_with_hyperlinks(paragraph: Paragraph) -> List[Dict[str, Any]]:
     - underline
     - whether the run is part of a hyperlink, and the hyperlink URL
 
-    The returned structure is:
-        [
-            {
-                "text": str,
-                "bold": bool,
-                "italic": bool,
-                "underline": bool,
-                "hyperlink": str | None,
-            },
-            ...
-        ]
+    `rels_cache` maps relationship ids to targets (see _load_docx_body).
+    When omitted, targets are resolved from the paragraph's part
+    relationships, only for the ids the paragraph actually references.
+    """
+    if rels_cache is None:
+        rels_cache = _PartRelsCache(paragraph.part.rels)
+    return _extract_runs(paragraph._p, rels_cache)
+
+
+class _PartRelsCache(dict):
+    """
+    rId -> target mapping filled on demand from a python-docx part's rels,
+    so a single paragraph does not copy every relationship of its part.
+    """
+
+    def __init__(self, rels) -> None:
+        super().__init__()
+        self._rels = rels
+
+    def get(self, r_id, default=None):
+        if r_id in self:
+            return self[r_id]
+        rel = self._rels.get(r_id)
+        if rel is None or rel.reltype != _REL_TYPE_HYPERLINK:
+            return default
+        target = self[r_id] = str(rel.target_ref)
+        return target
+
+
+def _run_text(r) -> str:
+    """
+    Visible text of a w:r element, read from its direct children in one pass
+    (w:t text, plus "\t" / "\n" / "-" for tabs, line breaks and no-break
+    hyphens, as python-docx's Run.text does).
+    """
+    parts: List[str] = []
+    for child in r.iterchildren():
+        tag = child.tag
+        if tag == _W_T:
+            parts.append(child.text or "")
+        elif tag == _W_BR:
+            if child.get(_W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            equivalent = _TEXT_EQUIVALENTS.get(tag)
+            if equivalent is not None:
+                parts.append(equivalent)
+    return "".join(parts)
+
+
+def _extract_runs(p_elm, rels_cache: Dict[str, str]) -> List[RunData]:
+    """
+    Run extraction on a raw w:p element; see extract_runs_with_hyperlinks().
     """
-    runs_data: List[Dict[str, Any]] = []
+    runs_data: List[RunData] = []
 
     # ------------------------------------------------------------------
-    # 1) Build a map: low-level w:r element -> hyperlink URL (if any)
-    #
-    #    We support two Word hyperlink encodings:
+    # We support two Word hyperlink encodings:
     #
     #    (a) Relationship-based hyperlinks:
     #        <w:hyperlink r:id="rId5"><w:r>...</w:r></w:hyperlink>
@@ -92,118 +361,93 @@ def extract_runs_with_hyperlinks(paragraph: Paragraph) -> List[Dict[str, Any]]:
     #        <w:r>Visible Text</w:r>
     #        <w:fldChar w:fldCharType="end"/>
     #
-    #    We first collect (a), then add (b) only for runs that don't
-    #    already have a mapping.
+    # (b) is collected up-front from the paragraph's direct children;
+    # (a) is tracked while walking the runs, and real <w:hyperlink>
+    # elements always take precedence.
     # ------------------------------------------------------------------
-    hyperlink_map: Dict[Any, Optional[str]] = {}
-    p_elm = paragraph._p  # CT_P (low-level XML)
-    part = paragraph.part
-
-    # 1a) Relationship-based hyperlinks (<w:hyperlink r:id="...">)
-    for h in p_elm.findall(".//w:hyperlink", p_elm.nsmap):
-        r_id = h.get(qn("r:id"))
-        url: Optional[str] = None
-        if r_id is not None and r_id in part.rels:
-            rel = part.rels[r_id]
-            # python-docx exposes the target URL as .target_ref
-            target = getattr(rel, "target_ref", None)
-            if target is not None:
-                url = str(target)
-
-        # Mark all w:r inside this hyperlink with the URL
-        for r in h.findall(".//w:r", p_elm.nsmap):
-            hyperlink_map[r] = url
 
     # ------------------------------------------------------------------
-    # 1b) Also detect field-code style hyperlinks (HYPERLINK fields)
+    # 1) Field-code style hyperlinks (HYPERLINK fields)
     #     Word sometimes represents hyperlinks as fields instead of
-    #     <w:hyperlink> elements. These typically look like:
-    #
-    #       <w:fldChar w:fldCharType="begin"/>
-    #       <w:instrText> HYPERLINK "https://example.com" </w:instrText>
-    #       <w:fldChar w:fldCharType="separate"/>
-    #       <w:r>Visible text</w:r>
-    #       <w:fldChar w:fldCharType="end"/>
-    #
-    #     We scan those field instructions and map all w:r nodes between
-    #     'begin' and 'end' to the extracted URL, but ONLY if they do not
-    #     already have a hyperlink from the relationship-based mapping
-    #     above. That way, real <w:hyperlink> elements always take
-    #     precedence.
+    #     <w:hyperlink> elements. We scan those field instructions and map
+    #     all w:r nodes between 'begin' and 'end' to the extracted URL.
     # ------------------------------------------------------------------
+    field_links: Dict[Any, str] = {}
     current_field_link: Optional[str] = None
     inside_field = False
 
     for child in p_elm.iterchildren():
         tag = child.tag
 
-        # Field begins
-        if tag.endswith("fldChar") and child.get(qn("w:fldCharType")) == "begin":
-            inside_field = True
-            current_field_link = None
-
-        # Field instructions – look for HYPERLINK "url"
-        if tag.endswith("instrText") and inside_field:
-            instr = (child.text or "").strip()
-            if instr:
-                m = re.search(r'HYPERLINK\s+"([^"]+)"', instr)
-                if m:
-                    current_field_link = m.group(1)
-
-        # Field ends – stop applying the current link
-        if tag.endswith("fldChar") and child.get(qn("w:fldCharType")) == "end":
-            inside_field = False
-            current_field_link = None
-
-        # Apply the field-code hyperlink to runs that don't already
-        # have a mapping from <w:hyperlink>.
-        if tag.endswith("r") and inside_field and current_field_link:
-            if child not in hyperlink_map:
-                hyperlink_map[child] = current_field_link
+        if tag == _W_FLDCHAR:
+            field_char_type = child.get(_W_FLDCHARTYPE)
+            if field_char_type == "begin":
+                # Field begins
+                inside_field = True
+                current_field_link = None
+            elif field_char_type == "end":
+                # Field ends – stop applying the current link
+                inside_field = False
+                current_field_link = None
+
+        elif tag == _W_INSTRTEXT:
+            # Field instructions – look for HYPERLINK "url"
+            if inside_field:
+                instr = (child.text or "").strip()
+                if instr:
+                    m = re.search(r'HYPERLINK\s+"([^"]+)"', instr)
+                    if m:
+                        current_field_link = m.group(1)
+
+        elif tag == _W_R and inside_field and current_field_link:
+            field_links[child] = current_field_link
 
     # ------------------------------------------------------------------
     # 2) Walk all w:r nodes in document order (NOT paragraph.runs)
     #    python-docx does not currently expose w:hyperlink runs via
-    #    paragraph.runs, so we read directly from the XML tree.
+    #    paragraph.runs, so we read directly from the XML tree. A single
+    #    iterwalk emits w:hyperlink start/end and w:r events, so the
+    #    enclosing hyperlink is known when each run is reached.
     # ------------------------------------------------------------------
-    nsmap = p_elm.nsmap
-    for r in p_elm.findall(".//w:r", nsmap):
+    in_hyperlink = False
+    hyperlink_url: Optional[str] = None
+
+    for event, r in etree.iterwalk(
+        p_elm, events=("start", "end"), tag=(_W_HYPERLINK, _W_R)
+    ):
+        if r.tag == _W_HYPERLINK:
+            in_hyperlink = event == "start"
+            hyperlink_url = rels_cache.get(r.get(_R_ID)) if in_hyperlink else None
+            continue
+        if event != "start":
+            continue
+
         # Collect the visible text for this run
-        texts = [t.text or "" for t in r.findall(".//w:t", nsmap)]
-        run_text = "".join(texts)
+        run_text = _run_text(r)
         if not run_text:
             continue  # skip empty runs
 
+        # Hyperlinks are usually underlined in the UI, but in case the
+        # original formatting did something different, we still mark
+        # underline=True whenever we know it's a hyperlink (so there is no
+        # need to look for w:u on those runs).
+        url = hyperlink_url if in_hyperlink else field_links.get(r)
+        underline = bool(url)
+
         # Run formatting from XML
-        rPr = r.find("w:rPr", nsmap)
+        rPr = r.find(_W_RPR)
         bold = False
         italic = False
-        underline = False
 
         if rPr is not None:
-            if rPr.find("w:b", nsmap) is not None:
+            if rPr.find(_W_B) is not None:
                 bold = True
-            if rPr.find("w:i", nsmap) is not None:
+            if rPr.find(_W_I) is not None:
                 italic = True
-            if rPr.find("w:u", nsmap) is not None:
+            if not underline and rPr.find(_W_U) is not None:
                 underline = True
 
-        url = hyperlink_map.get(r)
-        if url:
-            # Hyperlinks are usually underlined in the UI, but in case the
-            # original formatting did something different, we still mark
-            # underline=True whenever we know it's a hyperlink.
-            underline = True
-
-        runs_data.append(
-            {
-                "text": run_text,
-                "bold": bold,
-                "italic": italic,
-                "underline": underline,
-                "hyperlink": url,
-            }
-        )
+        runs_data.append(RunData(run_text, bold, italic, underline, url))
 
     return runs_data
 
@@ -213,100 +457,183 @@ def extract_runs_with_hyperlinks(paragraph: Paragraph) -> List[Dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
-def _detect_list_kind(paragraph: Paragraph) -> Optional[str]:
+def _paragraph_text(p_elm) -> str:
+    """
+    Plain text of a w:p element, matching python-docx's Paragraph.text:
+    tabs map to "\t" and line breaks to "\n".
     """
-    Best-effort detection of bullet vs numbered lists.
+    return "".join(_run_text(r) for r in _XP_PARAGRAPH_RUNS(p_elm))
 
-    Strategy:
-    - Look at the style name (e.g. 'List Bullet', 'ISMS List Numbered').
-    - If that fails, fall back to checking Word's numbering XML (w:numPr).
+
+
+# Any style whose name contains "heading <n>", e.g.:
+#   "Heading 1"
+#   "ISMS Heading 2"
+#   "My Custom Heading 3"
+_HEADING_RE = re.compile(r"heading\s+([1-5])")
+
+# Style ids Word generates for the built-in and ISMS heading styles. A
+# paragraph whose w:pStyle carries one of these is classified straight from
+# the attribute; other styles go through the name-based rules below.
+_HEADING_STYLE_IDS: Dict[str, int] = {
+    f"{prefix}{level}": level
+    for prefix in ("Heading", "heading", "ISMSHeading")
+    for level in range(1, 6)
+}
+
+
+@lru_cache(maxsize=None)
+def _classify_style_name(style_name: str) -> Tuple[Optional[int], Optional[str]]:
     """
-    style = getattr(paragraph, "style", None)
-    name = getattr(style, "name", "") or ""
-    name_lower = name.lower()
+    Classify a paragraph style name as ``(heading_level, list_kind)``.
+
+    - heading_level: 1–5 for 'Heading N' / 'ISMS Heading N' styles, else None
+    - list_kind: 'bullet_list' / 'numbered_list' for list styles
+      (e.g. 'List Bullet', 'ISMS List Numbered'), else None
 
-    # 1) Style-based detection (works for 'List Bullet', 'ISMS List Bullet', etc.)
+    A document only uses a handful of styles, so results are memoised per
+    style name.
+    """
+    name_lower = style_name.lower()
+
+    # Most paragraphs are not headings: reject them without the regex.
+    if "heading" in name_lower:
+        m = _HEADING_RE.search(name_lower)
+        if m:
+            return int(m.group(1)), None
+
+    # Style-based list detection (works for 'List Bullet', 'ISMS List Bullet', etc.)
     if "bullet" in name_lower:
-        return "bullet_list"
+        return None, "bullet_list"
     if "number" in name_lower:
-        return "numbered_list"
+        return None, "numbered_list"
 
     # Treat generic 'List Paragraph' as bullet list
     if "list paragraph" in name_lower:
-        return "bullet_list"
-
-    # 2) Fallback: if the paragraph participates in a Word list
-    p_elm = paragraph._p  # CT_P
-    if p_elm is not None:
-        num_pr = p_elm.find(".//w:numPr", p_elm.nsmap)
-        if num_pr is not None:
-            # If you want *all* lists to become bullet lists, change to "bullet_list"
-            return "bullet_list"
+        return None, "bullet_list"
 
-    return None
+    return None, None
 
 
-def _paragraph_to_block(paragraph: Paragraph) -> Optional[Dict[str, Any]]:
+def _classify_paragraph(
+    p_elm,
+    styles_map: Dict[Optional[str], str],
+    rels_cache: Dict[str, str],
+) -> Tuple[str, Optional[int], Optional[Dict[str, Any]]]:
     """
-    Convert a paragraph to a JSON content block.
+    Inspect a w:p element once and return ``(kind, heading_level, block)``:
 
-    - Skips completely empty paragraphs.
-    - Detects bullet/numbered list items and emits 'bullet_list' /
-      'numbered_list' blocks so the renderer can map them to ISMS list styles.
-    - For any text-ish block we also capture rich runs, including hyperlinks.
+    - ("heading", level, None) for Heading N / ISMS Heading N paragraphs
+    - ("paragraph" | "bullet_list" | "numbered_list", None, block) for
+      content paragraphs; list items are detected from the style name and,
+      failing that, from Word's numbering XML (w:numPr)
+    - ("empty", None, None) for paragraphs without any text
+
+    Content blocks carry both the plain text and the rich runs (including
+    hyperlinks) so the renderer can prefer 'runs' when present.
     """
-    plain_text = paragraph.text or ""
+    # Read paragraph properties once: style id and list numbering
+    pPr = p_elm.find(_W_PPR)
+    style_id: Optional[str] = None
+    num_pr = None
+    if pPr is not None:
+        p_style = pPr.find(_W_PSTYLE)
+        if p_style is not None:
+            style_id = p_style.get(_W_VAL)
+        num_pr = pPr.find(_W_NUMPR)
+
+    heading_level = _HEADING_STYLE_IDS.get(style_id)
+    if heading_level is not None and style_id in styles_map:
+        return "heading", heading_level, None
+
+    style_name = styles_map.get(style_id)
+    if style_name is None:
+        style_name = styles_map.get(None, "")
+
+    heading_level, list_kind = _classify_style_name(style_name)
+    if heading_level is not None:
+        return "heading", heading_level, None
+
+    # The runs already hold every text fragment in order, so the plain
+    # text is derived from them rather than walking the paragraph again.
+    runs = _extract_runs(p_elm, rels_cache)
+    plain_text = "".join(run.text for run in runs)
     if not plain_text.strip():
         # Completely empty paragraph; usually we can skip
-        return None
+        return "empty", None, None
 
-    # Capture run fragments (with hyperlinks) up-front so we can reuse them
-    runs = extract_runs_with_hyperlinks(paragraph)
+    # Fallback: if the paragraph participates in a Word list
+    # (if you want *all* lists to become bullet lists, keep "bullet_list")
+    if list_kind is None and num_pr is not None:
+        list_kind = "bullet_list"
 
     # 1) List items become 'bullet_list' / 'numbered_list' blocks.
     #    We keep the existing text representation so the renderer can
     #    still group and restart numbering, but now we also attach 'runs'
     #    so hyperlinks are preserved.
-    list_kind = _detect_list_kind(paragraph)
     if list_kind is not None:
-        return {
+        return list_kind, None, {
             "kind": list_kind,        # "bullet_list" or "numbered_list"
             "text": [plain_text],     # one item per block (as before)
             "runs": runs,
         }
 
     # 2) Normal paragraphs (non-list)
-    return {
+    return "paragraph", None, {
         "kind": "paragraph",
         "text": plain_text,
         "runs": runs,
     }
 
 
+def _cell_text(tc) -> str:
+    """Texts of a w:tc's paragraphs, stripped, blank ones dropped, joined by newlines."""
+    texts = (_paragraph_text(p).strip() for p in tc.iterchildren(_W_P))
+    return "\n".join(text for text in texts if text)
 
 
-
-def _table_to_block(table: Table) -> Dict[str, Any]:
+def _table_to_block(tbl) -> Dict[str, Any]:
     """
-    Convert a Word table into a 'table' content block.
+    Convert a w:tbl element into a 'table' content block.
 
     Structure matches what word_renderer._render_table_block expects:
       - block.header: List[str] for the header row
       - block.rows:   List[List[str]] for data rows
-    """
-    rows_data: List[List[str]] = []
 
-    for row in table.rows:
-        row_cells: List[str] = []
-        for cell in row.cells:
-            # Join all paragraph texts in the cell with line breaks
-            texts = [
-                (p.text or "").strip()
-                for p in cell.paragraphs
-                if (p.text or "").strip()
-            ]
-            row_cells.append("\n".join(texts))
-        rows_data.append(row_cells)
+    Cells are laid out on the table grid the way python-docx's row.cells
+    does: a horizontally merged cell (w:gridSpan) repeats its text for each
+    grid column it spans, and a vertically merged continuation cell
+    (w:vMerge) repeats the text of the cell above it.
+    """
+    grid = tbl.find(_W_TBLGRID)
+    col_count = len(grid.findall(_W_GRIDCOL)) if grid is not None else 0
+
+    # Text of every grid position, row after row.
+    grid_texts: List[str] = []
+    row_count = 0
+    for tr in tbl.iterchildren(_W_TR):
+        row_count += 1
+        for tc in tr.iterchildren(_W_TC):
+            grid_span = 1
+            v_merge = None
+            tcPr = tc.find(_W_TCPR)
+            if tcPr is not None:
+                span_el = tcPr.find(_W_GRIDSPAN)
+                if span_el is not None:
+                    grid_span = int(span_el.get(_W_VAL))
+                merge_el = tcPr.find(_W_VMERGE)
+                if merge_el is not None:
+                    v_merge = merge_el.get(_W_VAL, "continue")
+
+            if v_merge == "continue":
+                for _ in range(grid_span):
+                    grid_texts.append(grid_texts[-col_count])
+            else:
+                grid_texts.extend([_cell_text(tc)] * grid_span)
+
+    rows_data: List[List[str]] = [
+        grid_texts[i * col_count:(i + 1) * col_count] for i in range(row_count)
+    ]
 
     header: List[str] = rows_data[0] if rows_data else []
     body_rows: List[List[str]] = rows_data[1:] if len(rows_data) > 1 else []
@@ -318,42 +645,7 @@ def _table_to_block(table: Table) -> Dict[str, Any]:
     }
 
 
-def _iter_block_items(doc: Document):
-    """
-    Yield top-level block items (Paragraph or Table) from the document body
-    in order.
-
-    This is the standard python-docx pattern for iterating mixed content.
-    """
-    body = doc.element.body
-    for child in body.iterchildren():
-        if child.tag == qn("w:p"):
-            yield Paragraph(child, doc)
-        elif child.tag == qn("w:tbl"):
-            yield Table(child, doc)
-
-
-def _get_heading_level(paragraph: Paragraph) -> Optional[int]:
-    """
-    Return a heading level (1–5) if the paragraph uses a Heading style,
-    otherwise None.
-
-    Recognises both built-in 'Heading N' and custom 'ISMS Heading N'.
-    """
-    style = getattr(paragraph, "style", None)
-    name = getattr(style, "name", "") or ""
-    name_lower = name.lower()
-
-    # Accept any style whose name contains "heading <n>", e.g.:
-    #   "Heading 1"
-    #   "ISMS Heading 2"
-    #   "My Custom Heading 3"
-    for lvl in range(1, 6):
-        token = f"heading {lvl}"
-        if token in name_lower:
-            return lvl
-
-    return None
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
 
 
 def _slugify(text: str) -> str:
@@ -361,18 +653,49 @@ def _slugify(text: str) -> str:
     Turn a heading title into a safe section key, e.g.:
     'Raw Data Specification' → 'raw_data_specification'.
     """
-    base = re.sub(r"[^a-zA-Z0-9]+", "_", text.strip().lower()).strip("_")
+    base = _SLUG_RE.sub("_", text.strip().lower()).strip("_")
     return base or "section"
 
 
-def _import_body_as_single_section(doc: Document, title: str) -> Dict[str, Any]:
+def _iter_body_events(
+    children: Iterable[Any],
+    rels_cache: Dict[str, str],
+    styles_map: Dict[Optional[str], str],
+) -> Iterator[Tuple[str, Optional[int], Any]]:
+    """
+    Classify w:body children in document order, yielding:
+
+      - ("heading", level, title) for Heading N / ISMS Heading N paragraphs
+      - ("block", None, block)    for paragraph, list and table blocks
+    """
+    for child in children:
+        if child.tag == _W_P:
+            kind, heading_level, block = _classify_paragraph(
+                child, styles_map, rels_cache
+            )
+            if kind == "heading":
+                heading_text = _paragraph_text(child).strip() or f"Heading {heading_level}"
+                yield "heading", heading_level, heading_text
+            elif block is not None:
+                yield "block", None, block
+
+        elif child.tag == _W_TBL:
+            yield "block", None, _table_to_block(child)
+
+
+def _import_body_as_single_section(
+    body,
+    title: str,
+    rels_cache: Dict[str, str],
+    styles_map: Dict[Optional[str], str],
+) -> Dict[str, Any]:
     """
     Import the main body of the document into a single top-level section
     ('record_content'), but:
 
       - Use Word Heading styles (Heading N / ISMS Heading N) to create
         nested subsections inside it.
-      - Preserve bullet / numbered lists via _paragraph_to_block().
+      - Preserve bullet / numbered lists via _classify_paragraph().
       - Preserve tables via _table_to_block().
     """
     root_section: Dict[str, Any] = {
@@ -389,39 +712,30 @@ def _import_body_as_single_section(doc: Document, title: str) -> Dict[str, Any]:
     def current_section() -> Dict[str, Any]:
         return section_stack[-1][1]
 
-    for item in _iter_block_items(doc):
-        if isinstance(item, Paragraph):
-            heading_level = _get_heading_level(item)
-            if heading_level is not None:
-                # This paragraph is a heading: create a new section.
-                heading_text = item.text.strip() or f"Heading {heading_level}"
-                key = _slugify(heading_text)
-
-                new_section: Dict[str, Any] = {
-                    "key": key,
-                    "title": heading_text,
-                    "level": heading_level + 1,  # nested under record_content
-                    "content": [],
-                    "subsections": [],
-                }
-
-                # Attach to the appropriate parent based on heading level.
-                while section_stack and section_stack[-1][0] >= heading_level + 1:
-                    section_stack.pop()
-                parent_section = section_stack[-1][1]
-                parent_section["subsections"].append(new_section)
+    for event, heading_level, payload in _iter_body_events(
+        body.iterchildren(), rels_cache, styles_map
+    ):
+        if event == "heading":
+            # This paragraph is a heading: create a new section.
+            new_section: Dict[str, Any] = {
+                "key": _slugify(payload),
+                "title": payload,
+                "level": heading_level + 1,  # nested under record_content
+                "content": [],
+                "subsections": [],
+            }
 
-                section_stack.append((heading_level + 1, new_section))
-                continue
+            # Attach to the appropriate parent based on heading level.
+            while section_stack and section_stack[-1][0] >= heading_level + 1:
+                section_stack.pop()
+            parent_section = section_stack[-1][1]
+            parent_section["subsections"].append(new_section)
 
-            # Normal paragraph: convert to a content block
-            block = _paragraph_to_block(item)
-            if block is not None:
-                current_section()["content"].append(block)
+            section_stack.append((heading_level + 1, new_section))
+            continue
 
-        elif isinstance(item, Table):
-            table_block = _table_to_block(item)
-            current_section()["content"].append(table_block)
+        # Normal paragraph / table: append its content block
+        current_section()["content"].append(payload)
 
     return root_section
 
@@ -431,6 +745,81 @@ def _import_body_as_single_section(doc: Document, title: str) -> Dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
+def _import_metadata(doc_id: str, title: str, doc_type: str) -> Dict[str, Any]:
+    """Metadata block for a freshly imported document."""
+    return {
+        "doc_id": doc_id,
+        "title": title,
+        "doc_type": doc_type,
+        "version": "0.1",
+        "status": "Draft",
+        "owner": "TBC",
+        "approver": None,
+        "related_documents": [],
+    }
+
+
+# Mandatory top-level sections, so DocumentModel passes its "mandatory
+# sections" validation. These are stubs (empty content); they can be
+# populated later, but their presence satisfies the schema and keeps the CLI
+# quiet. document_classification must have three subsections.
+_MANDATORY_SECTION_TEMPLATES: Tuple[Dict[str, Any], ...] = tuple(
+    {
+        "key": key,
+        "title": sec_title,
+        "level": level,
+        "subsections": tuple(
+            {"key": sub_key, "title": sub_title, "level": level + 1, "subsections": ()}
+            for sub_key, sub_title in subsections
+        ),
+    }
+    for key, sec_title, level, subsections in (
+        ("title_page", "Title Page", 1, ()),
+        ("document_control", "Document Control", 1, ()),
+        ("table_of_contents", "Table of Contents", 1, ()),
+        ("revision_history", "Revision History", 1, ()),
+        ("approval_signatures", "Approval Signatures", 1, ()),
+        (
+            "document_classification",
+            "Document Classification",
+            1,
+            (
+                ("distribution_list", "Distribution List"),
+                ("handling_requirements", "Handling Requirements"),
+                ("retention_period", "Retention Period"),
+            ),
+        ),
+        ("purpose", "Purpose", 1, ()),
+        ("scope", "Scope", 1, ()),
+        ("roles_and_responsibilities", "Roles and Responsibilities", 1, ()),
+        ("related_documents", "Related Documents", 1, ()),
+    )
+)
+
+
+def _mandatory_sections() -> List[Dict[str, Any]]:
+    """Fresh stub section dicts built from _MANDATORY_SECTION_TEMPLATES."""
+    return [
+        {
+            "key": tmpl["key"],
+            "title": tmpl["title"],
+            "level": tmpl["level"],
+            "content": [],
+            "subsections": [
+                {
+                    "key": sub["key"],
+                    "title": sub["title"],
+                    "level": sub["level"],
+                    "content": [],
+                    "subsections": [],
+                }
+                for sub in tmpl["subsections"]
+            ],
+        }
+        for tmpl in _MANDATORY_SECTION_TEMPLATES
+    ]
+
+
 def import_word_to_json(
     input_path: Path,
     doc_type: str,
@@ -461,91 +850,21 @@ def import_word_to_json(
           "sections": [ ... ]
         }
     """
-    doc = Document(str(input_path))
+    body, rels_cache, styles_map = _load_docx_body(input_path)
 
     if title is None:
         title = input_path.stem
 
-    metadata: Dict[str, Any] = {
-        "doc_id": doc_id,
-        "title": title,
-        "doc_type": doc_type,
-        "version": "0.1",
-        "status": "Draft",
-        "owner": "TBC",
-        "approver": None,
-        "related_documents": [],
-    }
+    metadata = _import_metadata(doc_id, title, doc_type)
 
     # Import the body into a single catch-all section
-    main_section = _import_body_as_single_section(doc, title)
+    main_section = _import_body_as_single_section(body, title, rels_cache, styles_map)
 
-    # ------------------------------------------------------------------
-    # Ensure mandatory top-level sections exist so DocumentModel passes
-    # its "mandatory sections" validation.
-    #
-    # These are stubs (empty content); they can be populated later, but
-    # their presence satisfies the schema and keeps the CLI quiet.
-    # ------------------------------------------------------------------
-    mandatory_sections: List[tuple[str, str]] = [
-        ("title_page", "Title Page"),
-        ("document_control", "Document Control"),
-        ("table_of_contents", "Table of Contents"),
-        ("revision_history", "Revision History"),
-        ("approval_signatures", "Approval Signatures"),
-        ("document_classification", "Document Classification"),
-        ("purpose", "Purpose"),
-        ("scope", "Scope"),
-        ("roles_and_responsibilities", "Roles and Responsibilities"),
-        ("related_documents", "Related Documents"),
-    ]
-
-    sections: List[Dict[str, Any]] = []
+    sections = _mandatory_sections()
 
-    # In case you later add more sections, collect any existing keys
-    existing_keys = {main_section.get("key")} if main_section.get("key") else set()
-
-    for key, sec_title in mandatory_sections:
-        if key in existing_keys:
-            continue
-
-        # Special case: document_classification must have three subsections
-        if key == "document_classification":
-            subsections = [
-                {
-                    "key": "distribution_list",
-                    "title": "Distribution List",
-                    "level": 2,
-                    "content": [],
-                    "subsections": [],
-                },
-                {
-                    "key": "handling_requirements",
-                    "title": "Handling Requirements",
-                    "level": 2,
-                    "content": [],
-                    "subsections": [],
-                },
-                {
-                    "key": "retention_period",
-                    "title": "Retention Period",
-                    "level": 2,
-                    "content": [],
-                    "subsections": [],
-                },
-            ]
-        else:
-            subsections = []
-
-        sections.append(
-            {
-                "key": key,
-                "title": sec_title,
-                "level": 1,
-                "content": [],
-                "subsections": subsections,
-            }
-        )
+    # The imported body always lands in "record_content", which is never one
+    # of the mandatory keys, so every stub is emitted unconditionally.
+    assert main_section["key"] not in {section["key"] for section in sections}
 
     # Finally, append the actual imported content
     sections.append(main_section)
@@ -557,6 +876,117 @@ def import_word_to_json(
     return json_data
 
 
+def import_word_to_json_stream(
+    input_path: Path,
+    out_fp: BinaryIO,
+    doc_type: str,
+    doc_id: str,
+    title: Optional[str] = None,
+) -> None:
+    """
+    Streaming variant of import_word_to_json(): write the same JSON document
+    to the binary file object `out_fp` while the body is being parsed.
+
+    word/document.xml is read with iterparse and each body child is freed
+    once its block has been written, so peak memory stays around one
+    paragraph/table rather than the whole XML tree plus the whole dict.
+    The output parses to the same data as import_word_to_json(); only the
+    whitespace layout differs (blocks are written compactly).
+    """
+    if title is None:
+        title = input_path.stem
+
+    with ExitStack() as stack:
+        # Only opening the package and reading its parts may fall back: once
+        # streaming starts, output has been written and errors must propagate.
+        try:
+            z = stack.enter_context(zipfile.ZipFile(input_path))
+            names = set(z.namelist())
+            if _DOCUMENT_PART not in names:
+                raise KeyError(_DOCUMENT_PART)
+            rels_xml = z.read(_DOCUMENT_RELS_PART) if _DOCUMENT_RELS_PART in names else None
+            styles_xml = z.read(_STYLES_PART) if _STYLES_PART in names else None
+            rels_cache = _read_rels_cache(rels_xml)
+            styles_map = _read_styles_map(styles_xml)
+            xml_fp = stack.enter_context(z.open(_DOCUMENT_PART))
+            children: Iterable[Any] = _iterparse_body_children(xml_fp)
+        except (KeyError, zipfile.BadZipFile):
+            stack.close()
+            # Non-standard package: load it whole, but still stream the output.
+            body, rels_cache, styles_map = _load_docx_body_with_python_docx(input_path)
+            children = body.iterchildren()
+
+        _write_json_stream(
+            out_fp,
+            _import_metadata(doc_id, title, doc_type),
+            title,
+            _iter_body_events(children, rels_cache, styles_map),
+        )
+
+
+def _write_json_stream(
+    out_fp: BinaryIO,
+    metadata: Dict[str, Any],
+    title: str,
+    events: Iterable[Tuple[str, Optional[int], Any]],
+) -> None:
+    """
+    Write {"metadata", "sections"} to `out_fp`, emitting the
+    'record_content' section tree incrementally from body events.
+
+    A section only ever receives content before its first subsection (the
+    newest heading is always the current section), so each section is
+    written as its "content" list, then its "subsections" list.
+    """
+
+    def open_section(key: str, sec_title: str, level: int) -> None:
+        out_fp.write(
+            b'{"key": ' + _dumps(key)
+            + b', "title": ' + _dumps(sec_title)
+            + b', "level": ' + str(level).encode("ascii")
+            + b', "content": ['
+        )
+        # [level, still writing "content", next item is the first]
+        stack.append([level, True, True])
+
+    def close_section() -> None:
+        _level, in_content, _first = stack.pop()
+        out_fp.write(b'], "subsections": []}' if in_content else b"]}")
+
+    def next_item(state: List[Any]) -> None:
+        if not state[2]:
+            out_fp.write(b",\n")
+        state[2] = False
+
+    stack: List[List[Any]] = []
+
+    out_fp.write(b'{"metadata": ' + _dumps(metadata) + b', "sections": [\n')
+    for section in _mandatory_sections():
+        out_fp.write(_dumps(section) + b",\n")
+
+    open_section("record_content", title, 1)
+    for event, heading_level, payload in events:
+        if event == "heading":
+            level = heading_level + 1  # nested under record_content
+            while stack[-1][0] >= level:
+                close_section()
+            parent = stack[-1]
+            if parent[1]:
+                out_fp.write(b'], "subsections": [')
+                parent[1] = False
+                parent[2] = True
+            next_item(parent)
+            open_section(_slugify(payload), payload, level)
+            continue
+
+        next_item(stack[-1])
+        out_fp.write(_dumps(payload))
+
+    while stack:
+        close_section()
+    out_fp.write(b"]}\n")
+
+
 def import_word_to_document_dict(
     path: str | Path,
     doc_type: str = "Record",
@@ -589,6 +1019,30 @@ def import_word_to_document_dict(
     )
 
 
+def _dumps(obj: Any) -> bytes:
+    """Compact UTF-8 JSON for one value (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, default=asdict).encode("utf-8")
+
+
+def write_json(data: Dict[str, Any], output_path: Path) -> None:
+    """
+    Write imported JSON to `output_path` (UTF-8, 2-space indent).
+
+    Uses orjson when it is installed and falls back to the stdlib encoder
+    otherwise; both produce the same layout.
+    """
+    if orjson is not None:
+        output_path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
+
+    with output_path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=asdict)
+
+
 # ---------------------------------------------------------------------------
 # CLI entry point (optional)
 # ---------------------------------------------------------------------------
@@ -615,22 +1069,36 @@ def main(argv: Optional[List[str]] = None) -> None:
         "--title",
         help="Document title; defaults to input filename without extension",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write the JSON while parsing (lower memory, compact layout)",
+    )
 
     args = parser.parse_args(argv)
 
     input_path = Path(args.input_docx)
     output_path = Path(args.output_json)
 
-    data = import_word_to_json(
-        input_path=input_path,
-        doc_type=args.doc_type,
-        doc_id=args.doc_id,
-        title=args.title,
-    )
-
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+
+    if args.stream:
+        with output_path.open("wb") as out_fp:
+            import_word_to_json_stream(
+                input_path=input_path,
+                out_fp=out_fp,
+                doc_type=args.doc_type,
+                doc_id=args.doc_id,
+                title=args.title,
+            )
+    else:
+        data = import_word_to_json(
+            input_path=input_path,
+            doc_type=args.doc_type,
+            doc_id=args.doc_id,
+            title=args.title,
+        )
+        write_json(data, output_path)
 
     print("[OK] Imported Word document:")
     print(f"     Source: {input_path}")
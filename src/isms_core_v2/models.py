@@ -1,8 +1,15 @@
 # src/isms_core_v2/models.py
 
 from __future__ import annotations
-from typing import Optional, List, Literal, ClassVar, Set
-from pydantic import BaseModel, Field, validator
+from typing import Optional, List, Literal, ClassVar, Dict, Set, Union, Annotated
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 
 
 # ------------------------------------------------------------
@@ -15,72 +22,82 @@ class RunFragment(BaseModel):
     This is what we use to preserve bold/italic/underline and hyperlinks
     from the source Word document.
     """
+    # from_attributes lets the importer's slotted RunData objects validate
+    # directly, without an intermediate dict per run.
+    model_config = ConfigDict(
+        validate_assignment=False, extra="ignore", from_attributes=True
+    )
+
     text: str
     bold: bool = False
     italic: bool = False
     underline: bool = False
     hyperlink: str | None = None
 
-class ContentBlock(BaseModel):
-    kind: Literal["paragraph", "bullet_list", "numbered_list", "table"]
+# Each block kind has its own model; pydantic picks the right one from the
+# "kind" discriminator, so per-kind requirements are plain field rules.
+
+class ParagraphBlock(BaseModel):
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
+    kind: Literal["paragraph"]
 
-    # For paragraph: can use rich runs instead of (or as well as) plain text.
-    # For bullet / numbered list, we still expect text.
+    # Can use rich runs instead of (or as well as) plain text.
     runs: List[RunFragment] | None = None
+    text: str | None = None
 
-    # For paragraph / bullet / numbered list
-    text: str | List[str] | None = None
-
-    # For table
-    header: List[str] | None = None        # Optional header row
-    rows: List[List[str]] | None = None    # Body rows
-    caption: str | None = None             # Optional caption
-
-    @validator("runs", always=True)
-    def validate_runs_for_text_blocks(cls, v, values):
-        """
-        Allow 'runs' for normal paragraphs and list items. Other block
-        kinds (tables, figures, etc.) must not use 'runs'.
-        """
-        kind = values.get("kind")
-        if kind not in ("paragraph", "bullet_list", "numbered_list") and v:
-            raise ValueError(
-                "'runs' is only supported for paragraph and list kinds"
-            )
-        return v
+    @model_validator(mode="after")
+    def require_text_or_runs(self) -> "ParagraphBlock":
+        """Paragraphs are valid if they have either text or runs."""
+        if self.text is None and not self.runs:
+            raise ValueError("'text' or 'runs' is required for kind=paragraph")
+        return self
 
 
-    @validator("text", always=True)
-    def validate_text_for_non_table(cls, v, values):
-        """
-        - paragraph: must have either text or runs (or both)
-        - bullet_list / numbered_list: must have text (same as before)
-        - table: no requirement on text
-        """
-        kind = values.get("kind")
-        runs = values.get("runs")
+class BulletListBlock(BaseModel):
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
 
-        if kind == "paragraph":
-            # Paragraphs are valid if they have either text or runs
-            if v is None and not runs:
-                raise ValueError("'text' or 'runs' is required for kind=paragraph")
+    kind: Literal["bullet_list"]
 
-        elif kind in ("bullet_list", "numbered_list"):
-            # Lists still require text as before
-            if v is None:
-                raise ValueError(f"'text' is required for kind={kind}")
+    # Lists still require text; runs (when present) carry rich formatting.
+    text: str | List[str]
+    runs: List[RunFragment] | None = None
 
-        return v
 
-    @validator("rows", always=True)
-    def validate_rows_for_table(cls, v, values):
-        kind = values.get("kind")
-        if kind == "table":
-            if v is None or len(v) == 0:
-                raise ValueError("'rows' is required and must be non-empty for kind=table")
+class NumberedListBlock(BaseModel):
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
+    kind: Literal["numbered_list"]
+
+    text: str | List[str]
+    runs: List[RunFragment] | None = None
+
+
+class TableBlock(BaseModel):
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
+    kind: Literal["table"]
+
+    rows: List[List[str]] = Field(min_length=1)   # Body rows (non-empty)
+    header: List[str] | None = None               # Optional header row
+    caption: str | None = None                    # Optional caption
+
+    # 'runs' is only supported for paragraph and list kinds; an empty list
+    # (as older exports wrote) is accepted and carries nothing
+    runs: Optional[List[RunFragment]] = None
+
+    @field_validator("runs", mode="after")
+    @classmethod
+    def reject_runs(cls, v):
+        if v:
+            raise ValueError("'runs' is only supported for paragraph and list kinds")
         return v
 
 
+ContentBlock = Annotated[
+    Union[ParagraphBlock, BulletListBlock, NumberedListBlock, TableBlock],
+    Field(discriminator="kind"),
+]
 
 
 # ------------------------------------------------------------
@@ -89,6 +106,8 @@ class ContentBlock(BaseModel):
 # ------------------------------------------------------------
 
 class Section(BaseModel):
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
     key: str
     title: str
     level: int = Field(ge=1, le=5)
@@ -101,10 +120,11 @@ class Section(BaseModel):
     #        raise ValueError("Section.level must be between 1 and 5")
     #    return v
 
-    @validator("subsections")
-    def enforce_subsection_levels(cls, subs, values):
+    @field_validator("subsections", mode="after")
+    @classmethod
+    def enforce_subsection_levels(cls, subs, info: ValidationInfo):
         """Subsections must have level = parent.level + 1"""
-        level = values.get("level", 1)
+        level = info.data.get("level", 1)
         for s in subs:
             if s.level != level + 1:
                 raise ValueError(
@@ -118,6 +138,8 @@ class Section(BaseModel):
 # ------------------------------------------------------------
 
 class DocMetadata(BaseModel):
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
     doc_id: str              # e.g. REC-OPS-001
     title: str
     doc_type: Literal["Record", "Policy", "Procedure"]
@@ -132,7 +154,8 @@ class DocMetadata(BaseModel):
     date_completed: str | None = None
     next_review_date: str | None = None
 
-    @validator("doc_id")
+    @field_validator("doc_id", mode="after")
+    @classmethod
     def doc_id_format(cls, v):
         # very light rule; can tighten later
         if len(v.strip()) == 0:
@@ -145,6 +168,8 @@ class DocMetadata(BaseModel):
 # ------------------------------------------------------------
 
 class DocumentModel(BaseModel):
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
     metadata: DocMetadata
     sections: List[Section]
 
@@ -167,28 +192,32 @@ class DocumentModel(BaseModel):
         "retention_period"
     }
 
-    @validator("sections")
-    def validate_mandatory_sections(cls, sections):
-        keys = {s.key for s in sections}
+    @model_validator(mode="after")
+    def validate_mandatory_sections(self) -> "DocumentModel":
+        # One pass over the top-level sections; the first section wins if a
+        # key is repeated.
+        by_key: Dict[str, Section] = {}
+        for s in self.sections:
+            by_key.setdefault(s.key, s)
 
         # Check top-level mandatory sections exist
-        missing = cls.MANDATORY_KEYS - keys
+        missing = self.MANDATORY_KEYS - by_key.keys()
         if missing:
             raise ValueError(f"Missing mandatory sections: {', '.join(sorted(missing))}")
 
         # Validate the document_classification subsections
-        classification = next((s for s in sections if s.key == "document_classification"), None)
+        classification = by_key.get("document_classification")
         if classification is None:
             raise ValueError("document_classification section missing")
 
         subkeys = {s.key for s in classification.subsections}
-        missing_sub = cls.CLASSIFICATION_SUBKEYS - subkeys
+        missing_sub = self.CLASSIFICATION_SUBKEYS - subkeys
         if missing_sub:
             raise ValueError(
                 f"document_classification missing subsections: {', '.join(sorted(missing_sub))}"
             )
 
-        return sections
+        return self
 
 
 
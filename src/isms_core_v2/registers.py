@@ -12,12 +12,12 @@ DocumentModel validation + Word generation.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable, List, Dict
+from typing import Iterable, List, Dict, NamedTuple, Optional, Sequence
 import csv
+import io
 
 from .models import (
     DocumentModel,
-    DocumentControlRegisterRow,
     ReferenceRegisterEntry,
 )
 
@@ -31,21 +31,86 @@ def _ensure_parent_dir(path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def _read_csv(path: Path) -> List[Dict[str, str]]:
-    if not path.is_file():
-        return []
-    with path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+class _CsvContents(NamedTuple):
+    rows: List[List[str]]
+    header: Optional[List[str]]  # None if the file is missing or empty
+    ends_with_newline: bool  # True for a missing / empty file too
+
 
+def _read_csv(path: Path, fieldnames: Sequence[str]) -> _CsvContents:
+    """
+    Read a register CSV as plain lists, one value per entry of `fieldnames`
+    (in that order), whatever the column order in the file's header.
+    Columns missing from the file read as "".
 
-def _write_csv(path: Path, fieldnames: Iterable[str], rows: List[Dict[str, str]]) -> None:
+    The file's own header and whether it ends with a newline come back with
+    the rows, so callers appending to it need not read it again.
+    """
+    if not path.is_file():
+        return _CsvContents([], None, True)
+    # One read of the whole file; the csv module then parses from memory.
+    text = path.read_bytes().decode("utf-8")
+    ends_with_newline = text[-1:] in ("", "\n", "\r")
+    reader = csv.reader(io.StringIO(text, newline=""))
+    header = next(reader, None)
+    if header is None:
+        return _CsvContents([], None, ends_with_newline)
+
+    # Position of each wanted field in the file (last one wins on a
+    # repeated header name, as with DictReader).
+    file_cols = {name: i for i, name in enumerate(header)}
+    cols = [file_cols.get(name) for name in fieldnames]
+    if cols == list(range(len(header))):
+        # Header already matches: just pad/trim short or long rows.
+        width = len(cols)
+        rows = [
+            (row + [""] * (width - len(row)))[:width]
+            for row in reader
+            if row
+        ]
+    else:
+        rows = [
+            [row[i] if i is not None and i < len(row) else "" for i in cols]
+            for row in reader
+            if row  # DictReader skips blank lines too
+        ]
+    return _CsvContents(rows, header, ends_with_newline)
+
+
+def _write_csv(path: Path, fieldnames: Iterable[str], rows: Iterable[Sequence[str]]) -> None:
+    _ensure_parent_dir(path)
+    # Serialise in memory and write the file in one go.
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+    writer.writerow(fieldnames)
+    writer.writerows(rows)
+    path.write_bytes(buf.getvalue().encode("utf-8"))
+
+
+def _append_csv(
+    path: Path,
+    fieldnames: Iterable[str],
+    new_rows: Iterable[Sequence[str]],
+    existing: _CsvContents,
+) -> None:
+    """
+    Append rows to a CSV without rewriting it. `existing` is what _read_csv
+    returned for the file: the header is written first when it had none;
+    callers must only append to files whose header already matches
+    `fieldnames`.
+    """
     _ensure_parent_dir(path)
-    with path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+
+    if not existing.ends_with_newline:
+        buf.write("\r\n")  # hand-edited file without a final newline
+    if existing.header is None:
+        writer.writerow(fieldnames)
+
+    writer.writerows(new_rows)
+    with path.open("ab") as f:
+        f.write(buf.getvalue().encode("utf-8"))
 
 
 # ---------------------------------------------------------------------------
@@ -67,23 +132,85 @@ DCR_FIELDNAMES = [
     "notes",
 ]
 
+_DCR_DOC_ID_COL = DCR_FIELDNAMES.index("doc_id")
+
 
-def _dcr_row_from_model(model: DocumentModel, output_path: Path) -> DocumentControlRegisterRow:
+def _dcr_row_from_model(model: DocumentModel, output_path: Path) -> Dict[str, str]:
+    """
+    The register row for this document as CSV strings, keyed in
+    DCR_FIELDNAMES order (the same values a DocumentControlRegisterRow would
+    hold; DocMetadata has already validated them, so no model is built here).
+    """
     m = model.metadata
-    return DocumentControlRegisterRow(
-        doc_id=m.doc_id,
-        title=m.title,
-        doc_type=m.doc_type if m.doc_type in ("Policy", "Procedure", "Record", "Template", "Other") else "Other",
-        version=m.version,
-        status=m.status if m.status in ("Draft", "For Review", "Approved", "Superseded", "Obsolete") else m.status,
-        owner=m.owner,
-        approver=m.approver,
-        confidentiality=getattr(m, "confidentiality", None),
-        date_completed=getattr(m, "date_completed", None),
-        next_review_date=getattr(m, "next_review_date", None),
-        file_path=str(output_path),
-        notes=None,
-    )
+    values = {
+        "doc_id": m.doc_id,
+        "title": m.title,
+        "doc_type": m.doc_type if m.doc_type in ("Policy", "Procedure", "Record", "Template", "Other") else "Other",
+        "version": m.version,
+        "status": m.status,
+        "owner": m.owner,
+        "approver": m.approver,
+        "confidentiality": getattr(m, "confidentiality", None),
+        "date_completed": getattr(m, "date_completed", None),
+        "next_review_date": getattr(m, "next_review_date", None),
+        "file_path": str(output_path),
+        "notes": None,
+    }
+    return {k: str(v) for k, v in values.items()}
+
+
+class DCRStore:
+    """
+    In-memory view of the Document Control Register CSV.
+
+    The register is read once on construction and indexed by doc_id, so
+    upserting many documents in one run is a dict lookup each rather than a
+    full read + rewrite of the CSV per document. Call flush() once at the
+    end to write the register back.
+
+        store = DCRStore(register_path)
+        for model, output_path in generated:
+            store.upsert(model, output_path)
+        store.flush()
+    """
+
+    def __init__(self, register_path: Path) -> None:
+        self.register_path = register_path
+        # existing rows, normalised to current fieldnames
+        self._rows: List[List[str]] = _read_csv(register_path, DCR_FIELDNAMES).rows
+        # every row per doc_id: a register may (wrongly) list a document twice,
+        # and all of its rows are kept up to date
+        self._by_id: Dict[str, List[List[str]]] = {}
+        for row in self._rows:
+            self._by_id.setdefault(row[_DCR_DOC_ID_COL], []).append(row)
+        self._dirty = False
+
+    def upsert(self, model: DocumentModel, output_path: Path) -> None:
+        """
+        Record this document in the register.
+
+        - If doc_id already exists, every row for it is updated.
+        - Otherwise, a new row is appended.
+        """
+        dcr_row = _dcr_row_from_model(model, output_path)
+        new_row = list(dcr_row.values())
+
+        existing = self._by_id.get(dcr_row["doc_id"])
+        if existing is not None:
+            # overwrite with current values
+            for row in existing:
+                row[:] = new_row
+        else:
+            self._rows.append(new_row)
+            self._by_id[dcr_row["doc_id"]] = [new_row]
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Write the register back to disk if anything was upserted."""
+        if not self._dirty:
+            return
+        _write_csv(self.register_path, DCR_FIELDNAMES, self._rows)
+        self._dirty = False
 
 
 def update_document_control_register(
@@ -96,27 +223,12 @@ def update_document_control_register(
 
     - If doc_id already exists, its row is updated.
     - Otherwise, a new row is appended.
-    """
-    rows = _read_csv(register_path)
-
-    dcr_row = _dcr_row_from_model(model, output_path)
-    dcr_dict = dcr_row.model_dump()
-
-    updated: List[Dict[str, str]] = []
-    found = False
-    for row in rows:
-        if row.get("doc_id") == dcr_row.doc_id:
-            # overwrite with current values
-            updated.append({k: str(dcr_dict.get(k, "")) for k in DCR_FIELDNAMES})
-            found = True
-        else:
-            # normalise existing row to current fieldnames
-            updated.append({k: row.get(k, "") for k in DCR_FIELDNAMES})
 
-    if not found:
-        updated.append({k: str(dcr_dict.get(k, "")) for k in DCR_FIELDNAMES})
-
-    _write_csv(register_path, DCR_FIELDNAMES, updated)
+    For several documents in one run, use a single DCRStore instead.
+    """
+    store = DCRStore(register_path)
+    store.upsert(model, output_path)
+    store.flush()
 
 
 # ---------------------------------------------------------------------------
@@ -136,23 +248,33 @@ MRR_FIELDNAMES = [
     "notes",
 ]
 
+_MRR_REF_ID_COL = MRR_FIELDNAMES.index("ref_id")
+_MRR_FIELD_SET = set(MRR_FIELDNAMES)
+
+# Columns that identify a reference; a row with the same values is a repeat.
+_MRR_DEDUP_COLS = [
+    MRR_FIELDNAMES.index(k) for k in ("source_doc_id", "target_identifier", "ref_type")
+]
+
+_REF_ID_PREFIX = "REF-"
 
-def _next_ref_id(existing_rows: List[Dict[str, str]]) -> str:
+
+def _max_ref_number(existing_rows: List[List[str]]) -> int:
     """
-    Generate a simple monotonically increasing REF-000001 style ID.
+    Highest N among existing REF-00000N style IDs (0 if there are none).
+    New IDs continue monotonically from here.
     """
-    prefix = "REF-"
     max_n = 0
     for row in existing_rows:
-        ref_id = row.get("ref_id") or ""
-        if not ref_id.startswith(prefix):
+        ref_id = row[_MRR_REF_ID_COL]
+        if not ref_id.startswith(_REF_ID_PREFIX):
             continue
-        tail = ref_id[len(prefix):]
+        tail = ref_id[len(_REF_ID_PREFIX):]
         if tail.isdigit():
             n = int(tail)
             if n > max_n:
                 max_n = n
-    return f"{prefix}{max_n + 1:06d}"
+    return max_n
 
 
 def _mrr_entries_from_model(model: DocumentModel) -> List[ReferenceRegisterEntry]:
@@ -196,24 +318,42 @@ def update_master_reference_register(
     """
     Append new reference entries for this document into the Master Reference Register CSV.
 
-    v0 behaviour:
-    - Does NOT attempt to de-duplicate across runs.
-      (Safe because REF IDs are unique; later we can add smarter merging.)
+    An entry whose (source_doc_id, target_identifier, ref_type) is already in
+    the register is skipped, so re-running generation for a document does not
+    add the same references again. Existing rows are never modified, so new
+    rows are appended to the file; it is only rewritten when its columns
+    differ from MRR_FIELDNAMES.
     """
-    existing = _read_csv(register_path)
+    # Existing rows, normalised to all known fields
+    existing = _read_csv(register_path, MRR_FIELDNAMES)
+    normalised_existing: List[List[str]] = existing.rows
 
-    # Convert existing rows back to dicts with all known fields
-    normalised_existing: List[Dict[str, str]] = [
-        {k: row.get(k, "") for k in MRR_FIELDNAMES} for row in existing
-    ]
+    seen = {tuple(row[i] for i in _MRR_DEDUP_COLS) for row in normalised_existing}
 
     entries = _mrr_entries_from_model(model)
 
-    # Assign ref_ids and append
+    # Assign ref_ids and append; scan for the current maximum only once
+    max_n = _max_ref_number(normalised_existing)
+    new_rows: List[List[str]] = []
     for entry in entries:
-        entry.ref_id = _next_ref_id(normalised_existing)
-        normalised_existing.append(
-            {k: str(entry.model_dump().get(k, "")) for k in MRR_FIELDNAMES}
-        )
-
-    _write_csv(register_path, MRR_FIELDNAMES, normalised_existing)
+        key = (entry.source_doc_id, entry.target_identifier, entry.ref_type)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        max_n += 1
+        entry.ref_id = f"{_REF_ID_PREFIX}{max_n:06d}"
+        # dump once per entry, only the fields the register stores
+        entry_dict = entry.model_dump(include=_MRR_FIELD_SET)
+        new_rows.append([str(entry_dict.get(k, "")) for k in MRR_FIELDNAMES])
+
+    if not new_rows:
+        if not register_path.is_file():
+            _write_csv(register_path, MRR_FIELDNAMES, [])
+        return
+
+    if existing.header in (None, MRR_FIELDNAMES):
+        _append_csv(register_path, MRR_FIELDNAMES, new_rows, existing)
+    else:
+        # Different column layout: rewrite every row in the current one
+        _write_csv(register_path, MRR_FIELDNAMES, normalised_existing + new_rows)
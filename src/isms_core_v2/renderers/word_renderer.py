@@ -12,18 +12,27 @@ Schema-driven renderer:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable, Dict, Callable, Set, List, Sequence, Any
+from typing import Iterable, Iterator, Dict, Callable, Set, List, Sequence, Any
+from weakref import WeakKeyDictionary
 
 from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
 from docx.text.paragraph import Paragraph
 from docx.document import Document as _Document
-from docx.table import Table
+from docx.table import Table, _Cell
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.opc.constants import RELATIONSHIP_TYPE
 
 
-from ..models import DocumentModel, Section, ContentBlock, DocMetadata  # adjust import if needed
+from ..models import (  # adjust import if needed
+    DocumentModel,
+    Section,
+    ContentBlock,
+    BulletListBlock,
+    NumberedListBlock,
+    DocMetadata,
+)
 
 import re
 
@@ -50,6 +59,42 @@ PLACEHOLDER_MAP: Dict[str, Callable[[DocMetadata], str]] = {
 # We can treat *all* of them as required in the template if you want:
 REQUIRED_PLACEHOLDERS: Set[str] = set(PLACEHOLDER_MAP.keys())
 
+# All placeholders as one alternation, so each paragraph is scanned once
+_PLACEHOLDER_RE = re.compile("|".join(re.escape(k) for k in PLACEHOLDER_MAP))
+
+
+def _table_rows(table: Table) -> List[List[_Cell]]:
+    """
+    The cells of each row of `table`, laid out like python-docx's row.cells
+    (merged cells repeated), but built from a single pass over the table
+    instead of one full-table pass per row.
+    """
+    cells = table._cells
+    cols = table._column_count
+    return [cells[i * cols:(i + 1) * cols] for i in range(len(table.rows))]
+
+
+_W_P = qn("w:p")
+_W_T = qn("w:t")
+_XML_SPACE = qn("xml:space")
+
+
+def _placeholder_roots(doc: _Document) -> Iterator[Any]:
+    """
+    Root elements whose text may hold metadata placeholders: the body (with
+    its tables), then each distinct header / footer part.
+    """
+    yield doc.element.body
+
+    seen: Set[Any] = set()
+    for section in doc.sections:
+        for header_footer in (section.header, section.footer):
+            root = header_footer._element
+            if root in seen:
+                continue  # linked to a previous section's header/footer
+            seen.add(root)
+            yield root
+
 
 def _apply_metadata_placeholders(doc: _Document, metadata: DocMetadata) -> None:
     """
@@ -59,54 +104,54 @@ def _apply_metadata_placeholders(doc: _Document, metadata: DocMetadata) -> None:
     - headers
     - footers
     with values from DocMetadata.
-    """
-
-    # Resolve all placeholder values once
-    resolved_map = {
-        placeholder: resolver(metadata)
-        for placeholder, resolver in PLACEHOLDER_MAP.items()
-    }
 
-    def replace_in_paragraphs(paragraphs):
-        for p in paragraphs:
+    Substitution happens inside the w:t text nodes, so the run formatting
+    around a placeholder is kept. A placeholder that Word split across
+    several runs (e.g. "[[DOC_" + "ID]]") cannot be fixed node by node; its
+    paragraph falls back to a whole-text rewrite, which resets its runs.
+    """
+
+    # Resolve only the placeholders the template actually uses, each once,
+    # on its first match
+    resolved_map: Dict[str, str] = {}
+
+    def substitute(match: re.Match) -> str:
+        placeholder = match.group(0)
+        value = resolved_map.get(placeholder)
+        if value is None:
+            value = resolved_map[placeholder] = PLACEHOLDER_MAP[placeholder](metadata)
+        return value
+
+    for root in _placeholder_roots(doc):
+        # Paragraphs that may still hold a split placeholder
+        split_candidates: List[Any] = []
+
+        for t in root.iter(_W_T):
+            text = t.text
+            if not text or "[" not in text:
+                continue  # no placeholder (or piece of one) in this node
+            if "[[" in text:
+                text = t.text = _PLACEHOLDER_RE.sub(substitute, text)
+                if text != text.strip():
+                    # keep leading/trailing spaces, as python-docx does
+                    t.set(_XML_SPACE, "preserve")
+            if "[" in text:
+                p_elm = next(t.iterancestors(_W_P), None)
+                if p_elm is not None and (
+                    not split_candidates or split_candidates[-1] is not p_elm
+                ):
+                    split_candidates.append(p_elm)
+
+        for p_elm in split_candidates:
+            p = Paragraph(p_elm, None)
             original = p.text or ""
-            if not original:
+            if "[[" not in original:
                 continue
-            new_text = original
-            for placeholder, value in resolved_map.items():
-                if placeholder in new_text:
-                    new_text = new_text.replace(placeholder, value)
+            new_text = _PLACEHOLDER_RE.sub(substitute, original)
             if new_text != original:
                 # This resets runs, which is fine for metadata-only paragraphs.
                 p.text = new_text
 
-    # Document body
-    replace_in_paragraphs(doc.paragraphs)
-
-    # Tables in body
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                replace_in_paragraphs(cell.paragraphs)
-
-    # Headers & footers
-    for section in doc.sections:
-        header = section.header
-        footer = section.footer
-
-        replace_in_paragraphs(header.paragraphs)
-        replace_in_paragraphs(footer.paragraphs)
-
-        for table in header.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    replace_in_paragraphs(cell.paragraphs)
-
-        for table in footer.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    replace_in_paragraphs(cell.paragraphs)
-
 
 # -------------------------------------------------------------------
 # Style maps and helpers
@@ -145,16 +190,47 @@ RESERVED_TEMPLATE_SECTIONS = {
 }
 
 
-def _apply_first_existing_style(paragraph: Paragraph, candidates: Iterable[str]) -> None:
+_W_SECTPR = qn("w:sectPr")
+
+# Style resolution is memoised per document part: the same few candidate
+# tuples are applied to every paragraph, and resolving a style name means a
+# lookup in the styles part (a KeyError for each missing candidate).
+_NO_STYLE = object()  # none of the candidates exists in the document
+_STYLE_ID_CACHE: "WeakKeyDictionary[Any, Dict[tuple, Any]]" = WeakKeyDictionary()
+
+
+def _resolve_style_id(part: Any, style_type: WD_STYLE_TYPE, candidates: Iterable[str]) -> Any:
     """
-    Try each style name in order; apply the first one that exists in the document.
+    Style id of the first candidate name that exists in `part`'s document
+    (None when it is the default style, as python-docx's style setters use
+    it), or _NO_STYLE if none exists.
     """
-    for style_name in candidates:
+    per_part = _STYLE_ID_CACHE.get(part)
+    if per_part is None:
+        per_part = _STYLE_ID_CACHE[part] = {}
+
+    key = (style_type, tuple(candidates))
+    if key in per_part:
+        return per_part[key]
+
+    style_id = _NO_STYLE
+    for style_name in key[1]:
         try:
-            paragraph.style = style_name
-            return
+            style_id = part.get_style_id(style_name, style_type)
+            break
         except KeyError:
             continue
+    per_part[key] = style_id
+    return style_id
+
+
+def _apply_first_existing_style(paragraph: Paragraph, candidates: Iterable[str]) -> None:
+    """
+    Try each style name in order; apply the first one that exists in the document.
+    """
+    style_id = _resolve_style_id(paragraph.part, WD_STYLE_TYPE.PARAGRAPH, candidates)
+    if style_id is not _NO_STYLE:
+        paragraph._p.style = style_id
     # If none found, leave default style
 
 
@@ -162,15 +238,39 @@ def _apply_first_existing_table_style(table: Table, candidates: Iterable[str]) -
     """
     Try each table style name in order; apply the first one that exists.
     """
-    for style_name in candidates:
-        try:
-            table.style = style_name
-            return
-        except KeyError:
-            continue
+    style_id = _resolve_style_id(table.part, WD_STYLE_TYPE.TABLE, candidates)
+    if style_id is not _NO_STYLE:
+        table._tbl.tblStyle_val = style_id
     # If none found, leave Word's default table style
 
 
+def _new_body_paragraph(doc: Document, candidates: Iterable[str]) -> Paragraph:
+    """
+    Create a styled paragraph for the document body without inserting it yet;
+    collect several and add them with _append_body_paragraphs() in one go.
+    """
+    paragraph = Paragraph(OxmlElement("w:p"), doc._body)
+    _apply_first_existing_style(paragraph, candidates)
+    return paragraph
+
+
+def _append_body_paragraphs(doc: Document, paragraphs: Sequence[Paragraph]) -> None:
+    """
+    Insert paragraphs made by _new_body_paragraph() at the end of the body
+    (before the final w:sectPr, where doc.add_paragraph() puts them) with a
+    single splice.
+    """
+    if not paragraphs:
+        return
+    body = doc.element.body
+    elements = [p._p for p in paragraphs]
+    if len(body) and body[-1].tag == _W_SECTPR:
+        end = len(body) - 1
+        body[end:end] = elements
+    else:
+        body.extend(elements)
+
+
 
 def _add_hyperlink_run(
     paragraph: Paragraph,
@@ -318,15 +418,18 @@ def _render_runs_paragraph(
             text = frag.get("text") or ""
             bold = bool(frag.get("bold"))
             italic = bool(frag.get("italic"))
-            underline = bool(frag.get("underline"))
+            underline_set = frag.get("underline")
             href = frag.get("hyperlink")
         else:
             # Pydantic RunFragment model or any object with attributes
             text = getattr(frag, "text", "") or ""
             bold = bool(getattr(frag, "bold", False))
             italic = bool(getattr(frag, "italic", False))
-            underline = bool(getattr(frag, "underline", False))
+            underline_set = getattr(frag, "underline", None)
             href = getattr(frag, "hyperlink", None)
+            if "underline" not in getattr(frag, "model_fields_set", ("underline",)):
+                underline_set = None  # model default, not the author's choice
+        underline = bool(underline_set)
 
         if not text:
             continue
@@ -338,7 +441,8 @@ def _render_runs_paragraph(
                 text=text,
                 bold=bold,
                 italic=italic,
-                underline=underline or True,
+                # hyperlinks are underlined unless the fragment says otherwise
+                underline=True if underline_set is None else underline,
             )
         else:
             run = p.add_run(text)
@@ -453,14 +557,14 @@ def _normalise_block(block: ContentBlock) -> ContentBlock:
         clean = _BULLET_PREFIX_RE.sub("", text, count=1).strip()
         if not clean:
             return block
-        return ContentBlock(kind="bullet_list", text=[clean])
+        return BulletListBlock(kind="bullet_list", text=[clean])
 
     # Numbered-style text like "1. item", "2) item"
     if _NUMBER_PREFIX_RE.match(text):
         clean = _NUMBER_PREFIX_RE.sub("", text, count=1).strip()
         if not clean:
             return block
-        return ContentBlock(kind="numbered_list", text=[clean])
+        return NumberedListBlock(kind="numbered_list", text=[clean])
 
     return block
 
@@ -479,6 +583,7 @@ def _render_numbered_list_group(doc: Document, items: List[str]) -> None:
     automatic numbering enabled; it should just define indentation
     and spacing, so we avoid Word continuing numbering across lists.
     """
+    paragraphs: List[Paragraph] = []
     number = 1
     for raw in items:
         text = (raw or "").strip()
@@ -486,15 +591,18 @@ def _render_numbered_list_group(doc: Document, items: List[str]) -> None:
             continue
 
         # Create the paragraph and apply the numbered-list style
-        p = doc.add_paragraph()
-        _apply_first_existing_style(p, NUMBERED_STYLE_CANDIDATES)
+        p = _new_body_paragraph(doc, NUMBERED_STYLE_CANDIDATES)
 
         # Build "N. ..." and render it with inline hyperlink markers
         full_text = f"{number}. {text}"
         _add_text_with_inline_hyperlinks(p, full_text)
+        paragraphs.append(p)
 
         number += 1
 
+    # Add the whole list to the body at once
+    _append_body_paragraphs(doc, paragraphs)
+
 
 
 # -------------------------------------------------------------------
@@ -532,135 +640,93 @@ def _add_bullet_list_block(doc: Document, block: ContentBlock) -> None:
 
     # Fallback: old behaviour (no hyperlink information available),
     # but using our style helper instead of the old _find_first_existing_style.
+    paragraphs: List[Paragraph] = []
     for item_text in items:
         if not item_text:
             continue
 
-        para = doc.add_paragraph()
-        _apply_first_existing_style(para, BULLET_STYLE_CANDIDATES)
+        para = _new_body_paragraph(doc, BULLET_STYLE_CANDIDATES)
         # Allow inline hyperlink markers if they ever appear in bullet text
         _add_text_with_inline_hyperlinks(para, str(item_text))
 
         para_format = para.paragraph_format
         para_format.left_indent = Inches(0.5)
         para_format.first_line_indent = Inches(-0.25)
+        paragraphs.append(para)
 
+    # Add all items to the body at once
+    _append_body_paragraphs(doc, paragraphs)
 
 
 
 
-def _render_content_block(doc: Document, block: ContentBlock) -> None:
-    """
-    Render a non-numbered content block (paragraph, bullet_list, table, etc.).
 
-    Numbered lists are handled separately in the section renderer so that
-    we can group them and restart numbering at 1 per logical list.
+def _render_paragraph_block(doc: Document, block: ContentBlock) -> None:
+    """
+    Paragraphs: prefer rich runs if available, else fall back to plain text.
+    If the paragraph contains a hyperlink run, we render it with live links;
+    and if it looks like a "Reference link" bullet, we use the bullet style.
     """
+    runs = getattr(block, "runs", None)
 
-    # ---------------------------------------------------------
-    # Paragraphs: prefer rich runs if available, else fall back
-    # to plain text. If the paragraph contains a hyperlink run,
-    # we render it with live links; and if it looks like a
-    # "Reference link" bullet, we use the bullet style.
-    # ---------------------------------------------------------
-    if block.kind == "paragraph":
-        runs = getattr(block, "runs", None)
-
-        if runs:
-            # Detect if any run has a hyperlink
-            def _get_href(frag: Any) -> str | None:
-                if isinstance(frag, dict):
-                    return frag.get("hyperlink")
-                return getattr(frag, "hyperlink", None)
-
-            has_href = any(_get_href(frag) for frag in runs)
-
-            if has_href:
-                # Build the full text so we can detect "Reference link" prefix
-                def _get_text(frag: Any) -> str:
-                    if isinstance(frag, dict):
-                        return (frag.get("text") or "")
-                    return getattr(frag, "text", "") or ""
-
-                full_text = "".join(_get_text(frag) for frag in runs)
-                is_reference_link = full_text.strip().lower().startswith("reference link")
-
-                # Choose style: bullet style for "Reference link…" items,
-                # body style for other hyperlink paragraphs
-                style_candidates = BULLET_STYLE_CANDIDATES if is_reference_link else BODY_STYLE_CANDIDATES
-
-                p = doc.add_paragraph()
-                _apply_first_existing_style(p, style_candidates)
-
-                # Render runs into this paragraph, preserving hyperlink info
-                for frag in runs:
-                    # Support both dict and RunFragment model
-                    if isinstance(frag, dict):
-                        text = frag.get("text") or ""
-                        bold = bool(frag.get("bold"))
-                        italic = bool(frag.get("italic"))
-                        underline = bool(frag.get("underline"))
-                        href = frag.get("hyperlink")
-                    else:
-                        text = getattr(frag, "text", "") or ""
-                        bold = bool(getattr(frag, "bold", False))
-                        italic = bool(getattr(frag, "italic", False))
-                        underline = bool(getattr(frag, "underline", False))
-                        href = getattr(frag, "hyperlink", None)
-
-                    if not text:
-                        continue
-
-                    if href:
-                        _add_hyperlink_run(
-                            paragraph=p,
-                            url=str(href),
-                            text=text,
-                            bold=bold,
-                            italic=italic,
-                            # force underline for hyperlinks unless explicitly False
-                            underline=underline or True,
-                        )
-                    else:
-                        run = p.add_run(text)
-                        run.bold = bold
-                        run.italic = italic
-                        run.underline = underline
-
-                # Done – we handled this paragraph fully.
-                return
-
-            # Paragraph has runs but no hyperlinks → use the standard helper
-            _render_runs_paragraph(doc, runs, BODY_STYLE_CANDIDATES)
+    if not runs:
+        # No run fragments → plain paragraph text
+        _add_paragraph_block(doc, block)
+        return
 
-        else:
-            # No run fragments → plain paragraph text
-            _add_paragraph_block(doc, block)
+    # Detect if any run has a hyperlink
+    def _get_href(frag: Any) -> str | None:
+        if isinstance(frag, dict):
+            return frag.get("hyperlink")
+        return getattr(frag, "hyperlink", None)
 
-        return
+    style_candidates = BODY_STYLE_CANDIDATES
 
-    # ---------------------------------------------------------
-    # Bullets: use the existing list helper; importer populates
-    # text items. (No change here.)
-    # ---------------------------------------------------------
-    if block.kind == "bullet_list":
-        _add_bullet_list_block(doc, block)
+    if any(_get_href(frag) for frag in runs):
+        # Build the full text so we can detect "Reference link" prefix
+        def _get_text(frag: Any) -> str:
+            if isinstance(frag, dict):
+                return (frag.get("text") or "")
+            return getattr(frag, "text", "") or ""
 
+        full_text = "".join(_get_text(frag) for frag in runs)
+        if full_text.strip().lower().startswith("reference link"):
+            # bullet style for "Reference link…" items, body style for
+            # other hyperlink paragraphs
+            style_candidates = BULLET_STYLE_CANDIDATES
 
-    # Tables: render via table helper (unchanged)
-    if block.kind == "table":
-        _render_table_block(doc, block)
-        return
+    # Render runs into the paragraph, preserving hyperlink info
+    _render_runs_paragraph(doc, runs, style_candidates)
 
-    # Numbered lists are rendered via _render_section_recursive/_render_numbered_list_group,
-    # so we don't handle them here.
-    if block.kind == "numbered_list":
-        return
 
-    # Future-proof: ignore unknown kinds gracefully
+def _render_numbered_list_block(doc: Document, block: ContentBlock) -> None:
+    """
+    Numbered lists are rendered via _render_section_content/_render_numbered_list_group,
+    so a lone numbered_list block is not handled here.
+    """
     return
 
 
+# ContentBlock.kind → renderer. Looked up once per block instead of walking an
+# if/elif chain; unknown kinds are ignored gracefully.
+_BLOCK_RENDERERS: Dict[str, Callable[[Document, ContentBlock], None]] = {
+    "paragraph": _render_paragraph_block,
+    "bullet_list": _add_bullet_list_block,
+    "table": _render_table_block,
+    "numbered_list": _render_numbered_list_block,
+}
+
+
+def _render_content_block(doc: Document, block: ContentBlock) -> None:
+    """
+    Render a non-numbered content block (paragraph, bullet_list, table, etc.).
+
+    Numbered lists are handled separately in the section renderer so that
+    we can group them and restart numbering at 1 per logical list.
+    """
+    renderer = _BLOCK_RENDERERS.get(block.kind)
+    if renderer is not None:
+        renderer(doc, block)
 
 
 # -------------------------------------------------------------------
@@ -682,15 +748,13 @@ def _update_core_properties(doc: Document, metadata: DocMetadata) -> None:
     # core.comments = "Generated by ISMS Hybrid v2"
 
 
+# Characters dropped from table labels before alias matching
+_NORM_TABLE = str.maketrans({" ": None, "\n": None, ":": None})
+
+
 # Normalisation helper for table labels
 def _normalise_label(text: str) -> str:
-    return (
-        text.strip()
-        .lower()
-        .replace(" ", "")
-        .replace("\n", "")
-        .replace(":", "")
-    )
+    return text.strip().lower().translate(_NORM_TABLE)
 
 
 # Labels we recognise in the first cell of a row → which metadata field to write
@@ -703,6 +767,13 @@ DOC_CONTROL_LABEL_ALIASES: dict[str, set[str]] = {
     "doc_type": {"documenttype", "doctype"},
 }
 
+# Flattened: normalised label → metadata field, one lookup per row
+_ALIAS_TO_KEY: dict[str, str] = {
+    alias: meta_key
+    for meta_key, aliases in DOC_CONTROL_LABEL_ALIASES.items()
+    for alias in aliases
+}
+
 
 def _get_metadata_value(metadata: DocMetadata, key: str) -> str:
     if key == "doc_id":
@@ -718,7 +789,11 @@ def _get_metadata_value(metadata: DocMetadata, key: str) -> str:
     return ""
 
 
-def _update_document_control_table(doc: Document, metadata: DocMetadata) -> None:
+def _update_document_control_table(
+    doc: Document,
+    metadata: DocMetadata,
+    tables: Sequence[Table] | None = None,
+) -> None:
     """
     Find the Document Control table and write DocID, Version, Owner, Status
     based on label matching in the first cell of each row.
@@ -727,21 +802,25 @@ def _update_document_control_table(doc: Document, metadata: DocMetadata) -> None
     - There is a table on the Document Control page whose rows contain labels like:
         "Doc ID", "Document ID", "Version", "Owner", "Status"
     - The value is in the second cell of the row (or last cell if only 1).
+
+    `tables` is the body's doc.tables when the caller already has it.
     """
-    for table in doc.tables:
-        for row in table.rows:
-            if not row.cells:
+    if tables is None:
+        tables = doc.tables
+
+    for table in tables:
+        for row_cells in _table_rows(table):
+            if not row_cells:
                 continue
 
-            label_cell = row.cells[0]
+            label_cell = row_cells[0]
             label_norm = _normalise_label(label_cell.text)
 
-            for meta_key, aliases in DOC_CONTROL_LABEL_ALIASES.items():
-                if label_norm in aliases:
-                    # choose value cell: second cell if exists, else last
-                    value_cell = row.cells[1] if len(row.cells) > 1 else row.cells[-1]
-                    value_cell.text = _get_metadata_value(metadata, meta_key)
-                    break
+            meta_key = _ALIAS_TO_KEY.get(label_norm)
+            if meta_key is not None:
+                # choose value cell: second cell if exists, else last
+                value_cell = row_cells[1] if len(row_cells) > 1 else row_cells[-1]
+                value_cell.text = _get_metadata_value(metadata, meta_key)
         # We don't break out of table loop because other tables may also exist;
         # this is safe and idempotent.
 
@@ -750,26 +829,13 @@ def _update_document_control_table(doc: Document, metadata: DocMetadata) -> None
 # Section rendering
 # -------------------------------------------------------------------
 
-def _add_section_heading(doc: Document, section: Section) -> Paragraph:
+def _render_section_content(doc: Document, section: Section) -> None:
     """
-    Append a section heading at the end of the document with an appropriate ISMS Heading style.
-    """
-    heading_paragraph = doc.add_paragraph(section.title or "")
-    style_candidates = HEADING_STYLE_MAP.get(section.level, ("Heading 1",))
-    _apply_first_existing_style(heading_paragraph, style_candidates)
-    return heading_paragraph
-
-
-def _render_section_recursive(doc: Document, section: Section) -> None:
-    """
-    Render a section heading + content + all subsections, appended at the end of the document.
+    Render a section's own content blocks (not its subsections).
 
     Numbered lists are grouped so that each logical list (a run of numbered_list
     blocks with no interruption) restarts at 1.
     """
-    # Append heading
-    _add_section_heading(doc, section)
-
     numbered_buffer: List[str] = []
 
     def flush_numbered() -> None:
@@ -801,9 +867,41 @@ def _render_section_recursive(doc: Document, section: Section) -> None:
     # End of section content: flush any trailing numbered list
     flush_numbered()
 
-    # Render subsections after content
-    for sub in section.subsections:
-        _render_section_recursive(doc, sub)
+
+def _render_sections(doc: Document, sections: Iterable[Section]) -> None:
+    """
+    Render each section heading + content + all subsections, appended at the
+    end of the document in document order (depth-first, subsections after
+    their parent's content).
+
+    Walks the tree with an explicit stack rather than recursion, and resolves
+    the heading style of each level only once.
+    """
+    heading_style_ids: Dict[int, Any] = {}
+
+    stack: List[Section] = list(sections)
+    stack.reverse()
+    while stack:
+        section = stack.pop()
+
+        # Append heading with the ISMS Heading style for its level
+        if section.level in heading_style_ids:
+            style_id = heading_style_ids[section.level]
+        else:
+            style_id = heading_style_ids[section.level] = _resolve_style_id(
+                doc.part,
+                WD_STYLE_TYPE.PARAGRAPH,
+                HEADING_STYLE_MAP.get(section.level, ("Heading 1",)),
+            )
+        heading_paragraph = doc.add_paragraph(section.title or "")
+        if style_id is not _NO_STYLE:
+            heading_paragraph._p.style = style_id
+
+        _render_section_content(doc, section)
+
+        # Render subsections after content (pushed last-first so the first
+        # subsection is popped next)
+        stack.extend(reversed(section.subsections))
 
 
 # -------------------------------------------------------------------
@@ -819,11 +917,16 @@ def _render_title_page(doc: Document, model: DocumentModel, section: Section) ->
     _update_core_properties(doc, model.metadata)
 
 
-def _render_document_control(doc: Document, model: DocumentModel, section: Section) -> None:
+def _render_document_control(
+    doc: Document,
+    model: DocumentModel,
+    section: Section,
+    tables: Sequence[Table] | None = None,
+) -> None:
     """
     Map DocMetadata into the Document Control table (if found).
     """
-    _update_document_control_table(doc, model.metadata)
+    _update_document_control_table(doc, model.metadata, tables)
 
 
 def _render_table_of_contents(doc: Document, model: DocumentModel, section: Section) -> None:
@@ -836,14 +939,21 @@ def _render_table_of_contents(doc: Document, model: DocumentModel, section: Sect
     return
 
 
-def _dispatch_reserved_section(doc: Document, model: DocumentModel, section: Section) -> None:
+def _dispatch_reserved_section(
+    doc: Document,
+    model: DocumentModel,
+    section: Section,
+    tables: Sequence[Table] | None = None,
+) -> None:
     """
     Call the appropriate handler for sections whose layout is pre-built in the template.
+
+    `tables` is the body's doc.tables, fetched once by render_document().
     """
     if section.key == "title_page":
         _render_title_page(doc, model, section)
     elif section.key == "document_control":
-        _render_document_control(doc, model, section)
+        _render_document_control(doc, model, section, tables)
     elif section.key == "table_of_contents":
         _render_table_of_contents(doc, model, section)
     else:
@@ -888,18 +998,21 @@ def render_document(
 
     doc = Document(str(template_path))
 
+    # The template's tables, fetched once for the doc-control pass
+    tables = doc.tables
+
     # First, handle reserved sections (title page, doc control, TOC)
     for section in model.sections:
         if section.key in RESERVED_TEMPLATE_SECTIONS:
-            _dispatch_reserved_section(doc, model, section)
+            _dispatch_reserved_section(doc, model, section, tables)
 
     # Apply [[DOC_*]] placeholders everywhere
     _apply_metadata_placeholders(doc, model.metadata)
 
     # Then render all non-reserved sections at the end of the document
-    for section in model.sections:
-        if section.key in RESERVED_TEMPLATE_SECTIONS:
-            continue
-        _render_section_recursive(doc, section)
+    _render_sections(
+        doc,
+        (s for s in model.sections if s.key not in RESERVED_TEMPLATE_SECTIONS),
+    )
 
     doc.save(str(output_path))
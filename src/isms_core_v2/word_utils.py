@@ -12,46 +12,261 @@ Note: Custom Properties inside DOCX are not edited here (requires additional lib
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence
+import sys
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from weakref import WeakKeyDictionary
+
+from lxml import etree
 
 from docx.document import Document as _Document
+from docx.enum.style import WD_STYLE_TYPE
 from docx.text.paragraph import Paragraph
 from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.oxml.ns import nsmap, qn
 
 
 # ---------------------------------------------------------------------------
 # Low-level helpers
 # ---------------------------------------------------------------------------
 
-def _find_heading_paragraph(doc: _Document, heading_text: str) -> Optional[Paragraph]:
-    """Return the first paragraph whose text matches heading_text (case-insensitive, trimmed)."""
+HeadingIndex = Dict[str, Paragraph]
+
+_XPATH_NS = {"w": nsmap["w"]}
+_W_P = qn("w:p")
+
+# Top-level body paragraphs styled "Heading N" / "ISMS Heading N" (matched on
+# the style id in w:pStyle, which is the name without spaces)
+_HEADING_PARAGRAPHS = etree.XPath(
+    "./w:p[w:pPr/w:pStyle[starts-with(@w:val, 'Heading')"
+    " or starts-with(@w:val, 'heading')"
+    " or starts-with(@w:val, 'ISMSHeading')]]",
+    namespaces=_XPATH_NS,
+)
+_PARAGRAPH_TEXT = etree.XPath(
+    "./w:r/w:t/text() | ./w:hyperlink/w:r/w:t/text()",
+    namespaces=_XPATH_NS,
+)
+
+
+def _heading_elements(doc: _Document) -> Iterator[Tuple[str, Any]]:
+    """Yield (normalised text, w:p element) for each heading paragraph in the body."""
+    for p_elm in _HEADING_PARAGRAPHS(doc.element.body):
+        yield "".join(_PARAGRAPH_TEXT(p_elm)).strip().lower(), p_elm
+
+
+def build_heading_index(doc: _Document) -> HeadingIndex:
+    """
+    Map normalised heading text (trimmed, lower-case) -> heading paragraph,
+    in a single pass over the document.
+
+    Only paragraphs styled "Heading N" / "ISMS Heading N" are indexed; the
+    first one wins when several share the same text. Build it once per
+    document and pass it to the *_under_heading helpers to avoid a full
+    paragraph scan per heading.
+    """
+    index: HeadingIndex = OrderedDict()
+    for key, p_elm in _heading_elements(doc):
+        if key and key not in index:
+            index[key] = Paragraph(p_elm, doc._body)
+    return index
+
+
+def _find_heading_paragraph(
+    doc: _Document,
+    heading_text: str,
+    index: Optional[HeadingIndex] = None,
+) -> Optional[Paragraph]:
+    """
+    Return the first paragraph whose text matches heading_text (case-insensitive, trimmed).
+
+    Heading-styled paragraphs are searched first, straight on the XML; if
+    none matches, any body paragraph with that text is accepted (tabs and
+    breaks inside a paragraph are not part of its text here). If `index`
+    (from build_heading_index) is given it is consulted before either scan.
+    """
     target = (heading_text or "").strip().lower()
     if not target:
         return None
 
-    for p in doc.paragraphs:
-        if p.text.strip().lower() == target:
+    if index is not None:
+        p = index.get(target)
+        if p is not None:
             return p
+
+    for key, p_elm in _heading_elements(doc):
+        if key == target:
+            return Paragraph(p_elm, doc._body)
+
+    # Any body paragraph with that text; read straight from the w:t nodes,
+    # and only joined when there is enough text to possibly match
+    target_len = len(target)
+    for p_elm in doc.element.body.iterchildren(_W_P):
+        pieces = _PARAGRAPH_TEXT(p_elm)
+        if sum(map(len, pieces)) < target_len:
+            continue
+        if "".join(pieces).strip().lower() == target:
+            return Paragraph(p_elm, doc._body)
     return None
 
 
+# Interned: these names are hashed / compared as dict keys on every lookup
+BODY_STYLE_CANDIDATES: Tuple[str, ...] = tuple(map(sys.intern, ("ISMS Body", "Normal")))
+HEADING1_STYLE_CANDIDATES: Tuple[str, ...] = tuple(map(sys.intern, ("ISMS Heading 1", "Heading 1")))
+
+# Resolved paragraph styles per document part, keyed by candidate tuple
+_STYLE_CACHE: "WeakKeyDictionary[Any, Dict[Tuple[str, ...], Any]]" = WeakKeyDictionary()
+
+
+def _first_paragraph_style(doc: _Document, candidates: Tuple[str, ...]) -> Any:
+    """
+    Return the first of `candidates` that exists in `doc` as a paragraph
+    style (a Style object, or None if none does). Resolved once per document.
+    """
+    cache = _STYLE_CACHE.get(doc.part)
+    if cache is None:
+        cache = _STYLE_CACHE[doc.part] = {}
+    try:
+        return cache[candidates]
+    except KeyError:
+        pass
+
+    resolved = None
+    styles = doc.styles
+    for name in candidates:
+        try:
+            style = styles[name]
+        except KeyError:
+            continue
+        if style.type == WD_STYLE_TYPE.PARAGRAPH:
+            resolved = style
+            break
+    cache[candidates] = resolved
+    return resolved
+
+
+def resolve_styles(doc: _Document) -> Dict[str, Any]:
+    """
+    The paragraph styles these helpers apply, resolved once for `doc`:
+
+        {"body": ISMS Body | Normal, "heading1": ISMS Heading 1 | Heading 1}
+
+    A value is None when none of its candidates exists in the document.
+    """
+    return {
+        "body": _first_paragraph_style(doc, BODY_STYLE_CANDIDATES),
+        "heading1": _first_paragraph_style(doc, HEADING1_STYLE_CANDIDATES),
+    }
+
+
+def _apply_style(paragraph: Paragraph, style: Any) -> None:
+    """Assign a resolved style; leave the paragraph untouched if there is none."""
+    if style is not None:
+        paragraph.style = style
+
+
 def _insert_paragraph_after(paragraph: Paragraph) -> Paragraph:
     """
-    Insert and return a new paragraph immediately *after* the given one.
+    Insert and return a new, empty paragraph immediately *after* the given one.
 
-    python-docx doesn't expose `insert_after`, so we do a small XML shuffle.
+    python-docx doesn't expose `insert_after`, so the new w:p is added as the
+    next sibling of the paragraph's element; the paragraph itself is untouched.
     """
-    new_p = paragraph.insert_paragraph_before("")
-    # swap text: insert_paragraph_before puts it above; we want effectively "after"
-    new_p.text, paragraph.text = paragraph.text, new_p.text
-    return new_p
+    new_p = OxmlElement("w:p")
+    paragraph._p.addnext(new_p)
+    return Paragraph(new_p, paragraph._parent)
 
 
 # ---------------------------------------------------------------------------
 # Hyperlink + rich run rendering
 # ---------------------------------------------------------------------------
 
+_REL_TYPE_HYPERLINK = sys.intern(
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+)
+
+# Hyperlink relationship ids per part, url -> r_id (relate_to scans all rels)
+_HYPERLINK_RID_CACHE: "WeakKeyDictionary[Any, Dict[str, str]]" = WeakKeyDictionary()
+
+_QN_RID = qn("r:id")
+_QN_VAL = qn("w:val")
+
+# Prebuilt hyperlink run properties per (bold, italic, underline); each call
+# deep-copies the template instead of building the rPr element by element
+_HYPERLINK_RPR_TEMPLATES: Dict[Tuple[bool, bool, bool], Any] = {}
+
+
+def _hyperlink_rpr(bold: bool, italic: bool, underline: bool) -> Any:
+    """Return a fresh w:rPr for a hyperlink run (blue, plus the given flags)."""
+    key = (bold, italic, underline)
+    template = _HYPERLINK_RPR_TEMPLATES.get(key)
+    if template is None:
+        template = OxmlElement("w:rPr")
+        for flag, tag, val in (
+            (bold, "w:b", "true"),
+            (italic, "w:i", "true"),
+            (underline, "w:u", "single"),
+        ):
+            if flag:
+                child = OxmlElement(tag)
+                child.set(_QN_VAL, val)
+                template.append(child)
+        color = OxmlElement("w:color")
+        color.set(_QN_VAL, "0000FF")
+        template.append(color)
+        _HYPERLINK_RPR_TEMPLATES[key] = template
+    return deepcopy(template)
+
+# Prebuilt run properties for plain runs, same markup as python-docx's
+# run.bold / run.italic / run.underline = True; None when nothing is set
+_RUN_RPR_TEMPLATES: Dict[Tuple[bool, bool, bool], Any] = {}
+
+_QN_SPACE = qn("xml:space")
+
+
+def _run_rpr(bold: bool, italic: bool, underline: bool) -> Any:
+    """Return a fresh w:rPr for a plain run, or None if no flag is set."""
+    if not (bold or italic or underline):
+        return None
+    key = (bold, italic, underline)
+    template = _RUN_RPR_TEMPLATES.get(key)
+    if template is None:
+        template = OxmlElement("w:rPr")
+        if bold:
+            template.append(OxmlElement("w:b"))
+        if italic:
+            template.append(OxmlElement("w:i"))
+        if underline:
+            u = OxmlElement("w:u")
+            u.set(_QN_VAL, "single")
+            template.append(u)
+        _RUN_RPR_TEMPLATES[key] = template
+    return deepcopy(template)
+
+
+def _make_run_xml(text: str, bold: bool, italic: bool, underline: bool) -> Any:
+    """
+    Build a complete w:r for a plain (non-hyperlink) run in one go, rather
+    than p.add_run() followed by three formatting setters.
+    """
+    new_run = OxmlElement("w:r")
+    r_pr = _run_rpr(bold, italic, underline)
+    if r_pr is not None:
+        new_run.append(r_pr)
+
+    if "\t" in text or "\n" in text or "\r" in text:
+        # tabs / line breaks become w:tab / w:br; let python-docx lay them out
+        new_run.text = text
+    else:
+        t = OxmlElement("w:t")
+        t.text = text
+        if text != text.strip():
+            t.set(_QN_SPACE, "preserve")
+        new_run.append(t)
+    return new_run
+
+
 def add_hyperlink_run(
     paragraph: Paragraph,
     url: str,
@@ -71,44 +286,20 @@ def add_hyperlink_run(
     directly for runs.
     """
     part = paragraph.part
-    # Create relationship ID for hyperlink
-    r_id = part.relate_to(
-        url,
-        "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink",
-        is_external=True,
-    )
+    # Relationship ID for the hyperlink, reused for repeated URLs
+    r_ids = _HYPERLINK_RID_CACHE.get(part)
+    if r_ids is None:
+        r_ids = _HYPERLINK_RID_CACHE[part] = {}
+    r_id = r_ids.get(url)
+    if r_id is None:
+        r_id = r_ids[url] = part.relate_to(url, _REL_TYPE_HYPERLINK, is_external=True)
 
     hyperlink = OxmlElement("w:hyperlink")
-    hyperlink.set(qn("r:id"), r_id)
+    hyperlink.set(_QN_RID, r_id)
 
-    # Create the run
+    # Create the run: bold / italic / underline flags, blue colour
     new_run = OxmlElement("w:r")
-    r_pr = OxmlElement("w:rPr")
-
-    # Bold
-    if bold:
-        b = OxmlElement("w:b")
-        b.set(qn("w:val"), "true")
-        r_pr.append(b)
-
-    # Italic
-    if italic:
-        i = OxmlElement("w:i")
-        i.set(qn("w:val"), "true")
-        r_pr.append(i)
-
-    # Underline
-    if underline:
-        u = OxmlElement("w:u")
-        u.set(qn("w:val"), "single")
-        r_pr.append(u)
-
-    # Blue color
-    color = OxmlElement("w:color")
-    color.set(qn("w:val"), "0000FF")
-    r_pr.append(color)
-
-    new_run.append(r_pr)
+    new_run.append(_hyperlink_rpr(bool(bold), bool(italic), bool(underline)))
 
     # Text node
     t = OxmlElement("w:t")
@@ -123,6 +314,7 @@ def render_rich_paragraph(
     doc: _Document,
     runs: Sequence[Dict[str, Any]],
     style_name: str = "ISMS Body",
+    paragraph: Optional[Paragraph] = None,
 ) -> Paragraph:
     """
     Render a paragraph composed of multiple run fragments, each containing:
@@ -136,42 +328,50 @@ def render_rich_paragraph(
         }
 
     If `hyperlink` is not None, a hyperlink run is created; otherwise a normal run.
+
+    The runs go into `paragraph` when given (e.g. one already placed under a
+    heading); otherwise a new paragraph is appended to the end of the body.
     """
-    p = doc.add_paragraph()
+    p = doc.add_paragraph() if paragraph is None else paragraph
     # Apply style (fallback to Normal)
-    for s in (style_name, "Normal"):
-        try:
-            p.style = s
-            break
-        except (KeyError, ValueError):
-            continue
+    if style_name == BODY_STYLE_CANDIDATES[0]:
+        candidates = BODY_STYLE_CANDIDATES
+    else:
+        candidates = (sys.intern(style_name), BODY_STYLE_CANDIDATES[1])
+    _apply_style(p, _first_paragraph_style(doc, candidates))
+
+    # All-plain paragraph (no formatting, no links): one run for the joined text
+    if not any(
+        frag.get("bold") or frag.get("italic") or frag.get("underline") or frag.get("hyperlink")
+        for frag in runs
+    ):
+        text = "".join(frag.get("text") or "" for frag in runs)
+        if text:
+            p._p.append(_make_run_xml(text, False, False, False))
+        return p
+
+    # Bound once: this loop runs per fragment, often hundreds per section
+    append = p._p.append
+    add_link = add_hyperlink_run
 
     for frag in runs:
-        text = frag.get("text") or ""
+        get = frag.get
+        text = get("text")
         if not text:
-            continue
+            continue  # whitespace-only fragments are kept: they separate words
 
-        bold = bool(frag.get("bold"))
-        italic = bool(frag.get("italic"))
-        underline = bool(frag.get("underline"))
-        href = frag.get("hyperlink")
+        bold, italic, underline, href = get("bold"), get("italic"), get("underline"), get("hyperlink")
 
         if href:
             # Hyperlink run
-            add_hyperlink_run(
-                paragraph=p,
-                url=str(href),
-                text=text,
-                bold=bold,
-                italic=italic,
-                underline=underline or True,
-            )
+            # underlined unless the fragment says otherwise
+            add_link(p, str(href), text, bool(bold), bool(italic), True if underline is None else bool(underline))
+        elif bold or italic or underline:
+            # Formatted run
+            append(_make_run_xml(text, bool(bold), bool(italic), bool(underline)))
         else:
-            # Normal run
-            run = p.add_run(text)
-            run.bold = bold
-            run.italic = italic
-            run.underline = underline
+            # Plain run: no formatting to resolve
+            append(_make_run_xml(text, False, False, False))
 
     return p
 
@@ -180,10 +380,45 @@ def render_rich_paragraph(
 # Heading-aware helpers (backwards-compatible)
 # ---------------------------------------------------------------------------
 
+def _add_text_body(doc: _Document, p: Paragraph, body: Optional[str], styles: Dict[str, Any]) -> None:
+    """Plain text: one body paragraph per non-blank line (old behaviour)."""
+    for line in str(body or "").splitlines():
+        if not line.strip():
+            continue
+        new_p = _insert_paragraph_after(p)
+        new_p.text = line.strip()
+        _apply_style(new_p, styles["body"])
+        p = new_p  # so subsequent lines are under the last inserted paragraph
+
+
+def _add_other_body(doc: _Document, p: Paragraph, body: Any, styles: Dict[str, Any]) -> None:
+    """Fallback: a single stringified body paragraph."""
+    new_p = _insert_paragraph_after(p)
+    new_p.text = str(body)
+    _apply_style(new_p, styles["body"])
+
+
+def _add_list_body(doc: _Document, p: Paragraph, body: List[Any], styles: Dict[str, Any]) -> None:
+    """A list of run fragments renders as one rich paragraph; any other list is stringified."""
+    if body and isinstance(body[0], dict) and "text" in body[0]:
+        render_rich_paragraph(doc, body, paragraph=_insert_paragraph_after(p))
+    else:
+        _add_other_body(doc, p, body, styles)
+
+
+# add_body_under_heading dispatch on type(body); other types are stringified
+_BODY_HANDLERS = {
+    str: _add_text_body,
+    type(None): _add_text_body,
+    list: _add_list_body,
+}
+
+
 def add_body_under_heading(
     doc: _Document,
     heading_text: str,
     body: Any,
+    index: Optional[HeadingIndex] = None,
 ) -> None:
     """
     Append body content under a heading, creating the heading if needed with ISMS styles.
@@ -192,63 +427,36 @@ def add_body_under_heading(
       - str: treated as plain text and split into paragraphs on line breaks (old behaviour)
       - list[dict]: treated as a list of run fragments for a *single* rich paragraph
                     (e.g. the `runs` array from JSON)
+
+    `index` is an optional heading index from build_heading_index; a heading
+    created here is added to it.
     """
-    p = _find_heading_paragraph(doc, heading_text)
+    styles = resolve_styles(doc)
+    p = _find_heading_paragraph(doc, heading_text, index)
     if p is None:
         # Create a new heading with ISMS Heading 1 if available
         p = doc.add_paragraph(heading_text or "")
-        for style_name in ("ISMS Heading 1", "Heading 1"):
-            try:
-                p.style = style_name
-                break
-            except KeyError:
-                continue
+        _apply_style(p, styles["heading1"])
+        if index is not None and p.text.strip():
+            index.setdefault(p.text.strip().lower(), p)
 
     # Insert content *after* the heading
-    if isinstance(body, str) or body is None:
-        text = str(body or "")
-        for line in text.splitlines():
-            if not line.strip():
-                continue
-            new_p = _insert_paragraph_after(p)
-            new_p.text = line.strip()
-            for style_name in ("ISMS Body", "Normal"):
-                try:
-                    new_p.style = style_name
-                    break
-                except KeyError:
-                    continue
-            p = new_p  # so subsequent lines are under the last inserted paragraph
-
-    elif isinstance(body, list) and body and isinstance(body[0], dict) and "text" in body[0]:
-        # Assume `body` is a list of run fragments (one paragraph)
-        # We'll create that paragraph under the heading.
-        new_p = _insert_paragraph_after(p)
-        # Temporarily create another paragraph, render runs there, then move XML
-        tmp_doc = doc  # same doc
-        rich_p = render_rich_paragraph(tmp_doc, body)
-        # Move runs from rich_p to new_p
-        for r in list(rich_p._p):
-            new_p._p.append(r)
-        # Remove the temporary empty paragraph
-        tmp_doc._body._body.remove(rich_p._p)
-    else:
-        # Fallback: stringified
-        text = str(body)
-        new_p = _insert_paragraph_after(p)
-        new_p.text = text
-        for style_name in ("ISMS Body", "Normal"):
-            try:
-                new_p.style = style_name
-                break
-            except KeyError:
-                continue
+    handler = _BODY_HANDLERS.get(type(body))
+    if handler is None:  # subclasses take their base type's handler
+        if isinstance(body, str):
+            handler = _add_text_body
+        elif isinstance(body, list):
+            handler = _add_list_body
+        else:
+            handler = _add_other_body
+    handler(doc, p, body, styles)
 
 
 def add_rich_blocks_under_heading(
     doc: _Document,
     heading_text: str,
     blocks: Sequence[Dict[str, Any]],
+    index: Optional[HeadingIndex] = None,
 ) -> None:
     """
     Convenience helper: given a list of content blocks (e.g. from JSON section.content),
@@ -257,44 +465,50 @@ def add_rich_blocks_under_heading(
     - If block["type"] == "paragraph" and "runs" present -> use rich rendering.
     - Else if block["type"] == "paragraph" and only "text" present -> plain text.
     - Other block types can be added as needed (tables, lists, etc.).
+
+    `index` is an optional heading index from build_heading_index; a heading
+    created here is added to it.
     """
-    p = _find_heading_paragraph(doc, heading_text)
+    styles = resolve_styles(doc)
+    p = _find_heading_paragraph(doc, heading_text, index)
     if p is None:
         # Create the heading if needed
         p = doc.add_paragraph(heading_text or "")
-        for style_name in ("ISMS Heading 1", "Heading 1"):
-            try:
-                p.style = style_name
-                break
-            except KeyError:
-                continue
+        _apply_style(p, styles["heading1"])
+        if index is not None and p.text.strip():
+            index.setdefault(p.text.strip().lower(), p)
+
+    # Paragraphs are built detached, then spliced in after the heading at once
+    parent = doc._body
+    new_elements: List[Any] = []
 
     for block in blocks:
         btype = block.get("type")
         if btype == "paragraph":
             runs = block.get("runs")
             text = block.get("text", "")
+            new_p = Paragraph(OxmlElement("w:p"), parent)
 
             if runs:
-                rich_p = render_rich_paragraph(doc, runs)
-                # Ensure it's positioned after the heading / previous content
-                p = rich_p
+                render_rich_paragraph(doc, runs, paragraph=new_p)
             else:
                 # Plain paragraph
-                new_p = _insert_paragraph_after(p)
                 new_p.text = text
-                for style_name in ("ISMS Body", "Normal"):
-                    try:
-                        new_p.style = style_name
-                        break
-                    except KeyError:
-                        continue
-                p = new_p
+                _apply_style(new_p, styles["body"])
+            new_elements.append(new_p._p)
 
         # TODO: handle tables, lists, etc. as needed
 
+    if new_elements:
+        heading_elm = p._p
+        body = heading_elm.getparent()
+        at = body.index(heading_elm) + 1
+        body[at:at] = new_elements
+
 
 __all__ = [
+    "build_heading_index",
+    "resolve_styles",
     "_find_heading_paragraph",
     "add_body_under_heading",
     "add_hyperlink_run",
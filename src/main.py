@@ -1,12 +1,39 @@
 # src/main.py
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from .isms_core.pipeline import generate_isms_doc
+from .isms_core.pipeline import generate_isms_doc, output_path_for
 
 BASE = Path(__file__).resolve().parents[1]
-samples = (BASE / "data" / "sample").glob("*.json")
+samples = sorted((BASE / "data" / "sample").glob("*.json"))
 template = BASE / "data" / "templates" / "ISMS_Master_Base.docx"
 outdir = BASE / "outputs" / "isms_docs"
 
-for json_path in samples:
-    out = generate_isms_doc(json_path, template, outdir)
-    print("Generated ISMS document:", out)
+
+def _is_up_to_date(json_path: Path) -> bool:
+    """True if the output exists and is newer than both the JSON and the template."""
+    out_path = output_path_for(json_path, outdir)
+    if not out_path.exists():
+        return False
+    return out_path.stat().st_mtime >= max(json_path.stat().st_mtime, template.stat().st_mtime)
+
+
+def main() -> None:
+    pending = []
+    for json_path in samples:
+        if _is_up_to_date(json_path):
+            print("Up to date, skipped:", json_path.name)
+        else:
+            pending.append(json_path)
+
+    # Each sample renders independently; only the template is shared (read-only)
+    render = partial(generate_isms_doc, template_path=template, output_dir=outdir)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for out in ex.map(render, pending):
+            print("Generated ISMS document:", out)
+
+
+# Guard needed for the process pool (workers re-import this module on Windows)
+if __name__ == "__main__":
+    main()